@@ -1,11 +1,18 @@
 import os
+import sys
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 import re
 
-def create_bar_presentation_final():
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ottobite_sunum'))
+from slide_master import build_layouts, drop_title, set_title
+
+CONTENT_FILE = "/Users/ahmet11159/.gemini/antigravity/scratch/bar_sunum_icerik_taslak.md"
+OUTPUT_PATH = "/Users/ahmet11159/Desktop/OTTOBITE_Bar_Departmani_Rehberi_Final.pptx"
+
+def create_bar_presentation_final(content_file=CONTENT_FILE, output_path=OUTPUT_PATH):
     # --- PREMİUM RENKLER ---
     TERRACOTTA_BG = RGBColor(186, 120, 93)  
     BURGUNDY_BOX = RGBColor(180, 70, 70)    
@@ -17,11 +24,6 @@ def create_bar_presentation_final():
     prs.slide_width = Inches(13.333)
     prs.slide_height = Inches(7.5)
 
-    def set_bg(slide):
-        slide.background.fill.solid()
-        slide.background.fill.fore_color.rgb = TERRACOTTA_BG
-
-    content_file = "/Users/ahmet11159/.gemini/antigravity/scratch/bar_sunum_icerik_taslak.md"
     if not os.path.exists(content_file): return
 
     with open(content_file, 'r', encoding='utf-8') as f:
@@ -29,15 +31,26 @@ def create_bar_presentation_final():
 
     pages_data = re.split(r'---|\n## SAYFA \d+:', full_text)
     
-    page_num = 1
     total_slides = 36
 
+    # Arka plan, başlık stili ve sayfa numarası master/layout'ta bir kez
+    margin_left = Inches(0.8)
+    content_width = prs.slide_width - (margin_left * 2)
+    layouts = build_layouts(
+        prs, background=TERRACOTTA_BG,
+        title=dict(left=margin_left, top=Inches(0.4), width=content_width, height=Inches(1),
+                   size=36, color=DARK_BROWN),
+        number=dict(left=prs.slide_width - Inches(1.5), top=prs.slide_height - Inches(0.6),
+                    width=Inches(1), height=Inches(0.3), size=10,
+                    color=RGBColor(140, 110, 90), total=total_slides),
+    )
+
     for i, raw_content in enumerate(pages_data):
         content = raw_content.strip()
         if not content: continue
         
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
-        set_bg(slide)
+        # Kapak serbest (sadece arka plan), iç sayfalar başlık + numara layout'u
+        slide = prs.slides.add_slide(layouts['blank'] if i == 0 else layouts['content'])
         
         lines = content.split('\n')
         
@@ -68,13 +81,9 @@ def create_bar_presentation_final():
             p2.font.size = Pt(18)
             p2.font.bold = True
             p2.font.color.rgb = WHITE
-            
-            page_num += 1
             continue
 
         # --- İÇ SAYFA YERLEŞİM AYARLARI ---
-        margin_left = Inches(0.8)
-        content_width = prs.slide_width - (margin_left * 2)
         y_pos = Inches(1.5)
         max_y = prs.slide_height - Inches(1.0) # Alttan 1 inç boşluk
         
@@ -82,6 +91,7 @@ def create_bar_presentation_final():
         total_items = len([l for l in lines if l.strip()])
         font_base = 22 if total_items < 10 else 18
         box_font = 20 if total_items < 10 else 17
+        has_title = False
 
         for line in lines:
             line = line.strip()
@@ -93,13 +103,8 @@ def create_bar_presentation_final():
             # Başlık
             if line.startswith('##'):
                 title = re.sub(r'^##\s*(\d+\.\s*SAYFA:\s*|SAYFA\s*\d+:\s*)?', '', line)
-                tx = slide.shapes.add_textbox(Inches(0.8), Inches(0.4), content_width, Inches(1))
-                tf = tx.text_frame
-                tf.text = title
-                p = tf.paragraphs[0]
-                p.font.size = Pt(36)
-                p.font.bold = True
-                p.font.color.rgb = DARK_BROWN
+                set_title(slide, title)
+                has_title = True
                 continue
 
             # Kutulu Vurgu Metni (Kırmızı Kutu)
@@ -158,20 +163,12 @@ def create_bar_presentation_final():
                 p.font.color.rgb = OFF_WHITE
                 y_pos += line_spacing
 
-        # Sayfa Numarası
-        num_box = slide.shapes.add_textbox(prs.slide_width - Inches(1.5), prs.slide_height - Inches(0.6), Inches(1), Inches(0.3))
-        tf = num_box.text_frame
-        tf.text = f"{page_num}/{total_slides}"
-        p = tf.paragraphs[0]
-        p.alignment = PP_ALIGN.RIGHT
-        p.font.size = Pt(10)
-        p.font.color.rgb = RGBColor(140, 110, 90)
-        
-        page_num += 1
+        if not has_title:
+            drop_title(slide)
 
-    out = "/Users/ahmet11159/Desktop/OTTOBITE_Bar_Departmani_Rehberi_Final.pptx"
-    prs.save(out)
-    print(f"Sunum HATASIZ ve PREMİUM olarak hazırlandı: {out}")
+    prs.save(output_path)
+    print(f"Sunum HATASIZ ve PREMİUM olarak hazırlandı: {output_path}")
+    return output_path
 
 if __name__ == "__main__":
     create_bar_presentation_final()
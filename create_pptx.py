@@ -2,12 +2,21 @@
 # -*- coding: utf-8 -*-
 """OTTOBITE Garson Davranışları ve İş Önceliği Rehberi - Modern PPTX Sunum Oluşturucu"""
 
+import os
+import sys
+
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
 
+# Ortak metin ölçüm motoru ottobite_sunum/ altında
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ottobite_sunum'))
+from slide_master import build_layouts, drop_title, set_title
+from text_metrics import wrapped_lines, box_width
+from themes import bind_scheme, scheme_bound
+
 # Renkler
 KIREMIT = RGBColor(0xB8, 0x4C, 0x3C)
 GRI_KUTU = RGBColor(0x3A, 0x3A, 0x50)  # Koyu gri-mor arka plan kutusu
@@ -16,41 +25,23 @@ ACIK_GRI = RGBColor(0xCC, 0xCC, 0xCC)
 ACCENT = RGBColor(0xC9, 0x5A, 0x48)
 ARKA_PLAN = RGBColor(0x1A, 0x1A, 0x2E)
 
-prs = Presentation()
-prs.slide_width = Inches(13.333)
-prs.slide_height = Inches(7.5)
+SLIDE_WIDTH = Inches(13.333)
+SLIDE_HEIGHT = Inches(7.5)
+OUTPUT_PATH = "/Users/ahmet11159/Desktop/OTTOBITE_Garson_Rehberi.pptx"
 
-def add_gradient_background(slide):
-    """Koyu arka plan ekle"""
-    background = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, prs.slide_height
-    )
-    background.fill.solid()
-    background.fill.fore_color.rgb = ARKA_PLAN
-    background.line.fill.background()
-    spTree = slide.shapes._spTree
-    sp = background._element
-    spTree.remove(sp)
-    spTree.insert(2, sp)
+# Başlık ve slayt numarası stili slide master'daki 'content' layout'unda
+TITLE_STYLE = dict(left=Inches(0.5), top=Inches(0.3), width=Inches(12.333), height=Inches(0.8),
+                   size=26, font="Arial")
+NUMBER_STYLE = dict(left=Inches(12.5), top=Inches(7.0), width=Inches(0.7), height=Inches(0.3),
+                    size=10, color=RGBColor(0x66, 0x66, 0x66), font="Arial")
 
 def add_title_shape(slide, title_text, is_main=False):
-    """Kiremit renkli başlık ekle"""
+    """Kiremit renkli başlık (layout placeholder'ı); ana başlık daha büyük"""
+    title_box = set_title(slide, title_text)
     if is_main:
-        left, top, width, height = Inches(0.5), Inches(0.4), Inches(12.333), Inches(1.2)
-        font_size = Pt(36)
-    else:
-        left, top, width, height = Inches(0.5), Inches(0.3), Inches(12.333), Inches(0.8)
-        font_size = Pt(26)
-    
-    title_box = slide.shapes.add_textbox(left, top, width, height)
-    tf = title_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = title_text
-    p.font.size = font_size
-    p.font.bold = True
-    p.font.color.rgb = KIREMIT
-    p.font.name = "Arial"
+        title_box.left, title_box.top = TITLE_STYLE['left'], Inches(0.4)
+        title_box.width, title_box.height = TITLE_STYLE['width'], Inches(1.2)
+        title_box.text_frame.paragraphs[0].font.size = Pt(36)
     return title_box
 
 def add_content_box(slide, content_lines, start_top=1.3, base_font_size=16):
@@ -90,9 +81,8 @@ def add_content_box(slide, content_lines, start_top=1.3, base_font_size=16):
             text_content = line[1:].strip()
             
             # Metin uzunluğuna göre kutu yüksekliği hesapla
-            # Yaklaşık 90 karakter bir satıra sığar (font 16, width 12 inch)
-            chars_per_line = 85
-            num_lines = max(1, (len(text_content) + chars_per_line - 1) // chars_per_line)
+            # Satır sayısı gerçek font metrikleriyle ölçülür (text box: width - 0.3 inch)
+            num_lines = wrapped_lines(text_content, 'Arial', font_size, box_width(width / 914400 - 0.3))
             dynamic_box_height = 0.35 + (num_lines * 0.25)  # Her satır için 0.25 inch ekle
             
             # Gri arka planlı rounded rectangle
@@ -166,18 +156,6 @@ def add_content_box(slide, content_lines, start_top=1.3, base_font_size=16):
     
     return current_top
 
-def add_slide_number(slide, num, total):
-    """Slayt numarası ekle"""
-    left, top = Inches(12.5), Inches(7.0)
-    text_box = slide.shapes.add_textbox(left, top, Inches(0.7), Inches(0.3))
-    tf = text_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = f"{num}/{total}"
-    p.font.size = Pt(10)
-    p.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
-    p.font.name = "Arial"
-    p.alignment = PP_ALIGN.RIGHT
-
 # ============ SLAYTLAR ============
 
 slides_data = [
@@ -962,50 +940,66 @@ slides_data = [
     }
 ]
 
-total_slides = len(slides_data)
+@scheme_bound
+def create_presentation(slides=None, output_path=OUTPUT_PATH):
+    """Sunumu oluştur; slides verilmezse yukarıdaki slides_data kullanılır"""
+    if slides is None:
+        slides = slides_data
+    prs = Presentation()
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
 
-for idx, slide_data in enumerate(slides_data):
-    slide_layout = prs.slide_layouts[6]  # Blank layout
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Gradient background
-    add_gradient_background(slide)
-    
-    if slide_data.get("is_cover"):
-        # Kapak slaytı
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.5), Inches(12.333), Inches(1.5))
-        tf = title_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = slide_data["title"]
-        p.font.size = Pt(60)
-        p.font.bold = True
-        p.font.color.rgb = KIREMIT
-        p.font.name = "Arial"
-        p.alignment = PP_ALIGN.CENTER
-        
-        subtitle_box = slide.shapes.add_textbox(Inches(0.5), Inches(4.2), Inches(12.333), Inches(1))
-        tf = subtitle_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = slide_data["subtitle"]
-        p.font.size = Pt(28)
-        p.font.color.rgb = ACIK_GRI
-        p.font.name = "Arial"
-        p.alignment = PP_ALIGN.CENTER
+    total_slides = len(slides)
+
+    # Arka plan, başlık stili ve slayt numarası ("n/toplam") master'da bir kez
+    layouts = build_layouts(
+        prs, background=ARKA_PLAN,
+        title=dict(TITLE_STYLE, color=KIREMIT),
+        number=dict(NUMBER_STYLE, total=total_slides),
+    )
+
+    for idx, slide_data in enumerate(slides):
+        slide = prs.slides.add_slide(layouts['content'])
         
-    elif slide_data.get("is_closing"):
-        # Kapanış slaytı
-        add_title_shape(slide, slide_data["title"], is_main=True)
-        add_content_box(slide, slide_data["content"], start_top=1.5, base_font_size=17)
-    else:
-        # Normal içerik slaytları
-        add_title_shape(slide, slide_data["title"])
-        add_content_box(slide, slide_data["content"])
-    
-    # Slayt numarası
-    add_slide_number(slide, idx + 1, total_slides)
+        if slide_data.get("is_cover"):
+            drop_title(slide)
+            # Kapak slaytı
+            title_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.5), Inches(12.333), Inches(1.5))
+            tf = title_box.text_frame
+            p = tf.paragraphs[0]
+            p.text = slide_data["title"]
+            p.font.size = Pt(60)
+            p.font.bold = True
+            p.font.color.rgb = KIREMIT
+            p.font.name = "Arial"
+            p.alignment = PP_ALIGN.CENTER
+            
+            subtitle_box = slide.shapes.add_textbox(Inches(0.5), Inches(4.2), Inches(12.333), Inches(1))
+            tf = subtitle_box.text_frame
+            p = tf.paragraphs[0]
+            p.text = slide_data["subtitle"]
+            p.font.size = Pt(28)
+            p.font.color.rgb = ACIK_GRI
+            p.font.name = "Arial"
+            p.alignment = PP_ALIGN.CENTER
+            
+        elif slide_data.get("is_closing"):
+            # Kapanış slaytı
+            add_title_shape(slide, slide_data["title"], is_main=True)
+            add_content_box(slide, slide_data["content"], start_top=1.5, base_font_size=17)
+        else:
+            # Normal içerik slaytları
+            add_title_shape(slide, slide_data["title"])
+            add_content_box(slide, slide_data["content"])
+
+    # Renkler tema slotlarına bağlanır (retheme.py sadece tema parçasını değiştirir)
+    bind_scheme(prs, sys.modules[__name__], 'create_pptx')
+
+    # Sunum kaydet
+    prs.save(output_path)
+    print(f"Sunum başarıyla oluşturuldu: {output_path}")
+    print(f"Toplam slayt sayısı: {total_slides}")
+    return output_path
 
-# Sunum kaydet
-output_path = "/Users/ahmet11159/Desktop/OTTOBITE_Garson_Rehberi.pptx"
-prs.save(output_path)
-print(f"Sunum başarıyla oluşturuldu: {output_path}")
-print(f"Toplam slayt sayısı: {total_slides}")
+if __name__ == "__main__":
+    create_presentation()
@@ -0,0 +1,158 @@
+# encoding: utf-8
+"""
+OTTOBITE Batch Renderer - tek işlemde çok sayıda sunum
+Manifest (JSON):
+    {"jobs": [
+        {"source": "perfect_text.txt", "renderer": "production",
+         "theme": "terracotta", "output": "out/Garson_Terracotta.pptx"},
+        {"source": "../bar_sunum_icerik_taslak.md", "renderer": "bar",
+         "output": "out/Bar.pptx"},
+        {"renderer": "service", "output": "out/Servis.pptx"}
+    ]}
+
+- renderer: pipeline.IMPLEMENTATIONS['render'] anahtarları (kaynak pipeline'dan
+  geçer, aşama cache'leri işler arasında paylaşılır), "service" (create_pptx,
+  kaynak opsiyonel slides_data JSON'u) veya "bar" (create_bar_pptx, markdown)
+- theme: "bar" renderer'ında desteklenmez (renkleri fonksiyon içi sabitler,
+  themes.applied onlara ulaşamaz); manifest yüklenirken reddedilir
+- source: "bar" renderer'ında zorunlu; eksikse manifest yüklenirken reddedilir
+- Kaynağı eksik veya çıktı dosyası yazılmamış iş başarılı sayılmaz, batch hata verir
+- Bağımsız sunumlar worker process'lerde paralel render edilir; her worker
+  generator modüllerini bir kez yükler ve sırası gelen tüm işlerde kullanır
+- Manifest'teki yollar manifest dosyasının klasörüne göredir
+
+Kullanım:
+    python batch_render.py manifest.json [-j 4]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+# Kök klasördeki departman scriptleri (create_pptx, create_bar_pptx)
+LEGACY_RENDERERS = {
+    'service': 'create_pptx:create_presentation',
+    'bar': 'create_bar_pptx:create_bar_presentation_final',
+}
+# Renkleri modül sabiti olmayan, tema uygulanamayan renderer'lar
+UNTHEMED_RENDERERS = {'bar'}
+
+
+def _legacy(renderer):
+    module_name, func_name = LEGACY_RENDERERS[renderer].split(':')
+    module = importlib.import_module(module_name)
+    return module, getattr(module, func_name)
+
+
+def init_worker(renderers):
+    """Tema, layout ve generator modülü kurulumu worker başına bir kez"""
+    for path in (HERE, ROOT):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    import pipeline
+    import themes  # noqa: F401
+    for renderer in renderers:
+        if renderer in LEGACY_RENDERERS:
+            _legacy(renderer)
+        else:
+            pipeline.resolve('render', renderer)
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def render_job(job):
+    import pipeline
+    import themes
+
+    started = time.perf_counter()
+    renderer = job.get('renderer', pipeline.DEFAULTS['render'])
+    theme = job.get('theme', 'default')
+    output = job['output']
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    before = _mtime(output)
+
+    if renderer in LEGACY_RENDERERS:
+        module, func = _legacy(renderer)
+        with themes.applied(module, theme):
+            if renderer == 'bar':
+                func(job['source'], output)
+            elif job.get('source'):
+                with open(job['source'], 'r', encoding='utf-8') as f:
+                    func(json.load(f), output)
+            else:
+                func(output_path=output)
+    else:
+        source = job.get('source', 'iş1.pdf')
+        choices = {stage: job.get(stage) or pipeline.DEFAULTS[stage] for stage in pipeline.STAGES}
+        choices['render'] = renderer
+        if not job.get('extract') and not source.lower().endswith('.pdf'):
+            choices['extract'] = 'text'
+        pipeline.run(source, output, choices, theme=theme)
+
+    # Eski scriptler hata yerine sessizce dönebilir (create_bar_pptx: kaynak yoksa return)
+    if _mtime(output) in (None, before):
+        raise RuntimeError(f"{renderer}: çıktı yazılmadı: {output}")
+    return output, time.perf_counter() - started
+
+
+def load_manifest(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        jobs = json.load(f)['jobs']
+    base = os.path.dirname(os.path.abspath(path))
+    for job in jobs:
+        for field in ('source', 'output'):
+            if job.get(field):
+                job[field] = os.path.join(base, job[field])
+        renderer = job.get('renderer', 'production')
+        if renderer in UNTHEMED_RENDERERS and job.get('theme', 'default') != 'default':
+            raise SystemExit(f"{renderer} renderer'ı tema desteklemiyor: {job['theme']} ({job['output']})")
+        if renderer == 'bar' and not job.get('source'):
+            raise SystemExit(f"{renderer} renderer'ı kaynak gerektirir: markdown dosyası verilmedi ({job['output']})")
+        if job.get('source') and not os.path.exists(job['source']):
+            raise SystemExit(f"Kaynak bulunamadı: {job['source']} ({job['output']})")
+    return jobs
+
+
+def run_batch(jobs, workers=None):
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    renderers = sorted({job.get('renderer', 'production') for job in jobs})
+    started = time.perf_counter()
+    if workers <= 1:
+        init_worker(renderers)
+        results = [render_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(renderers,)) as pool:
+            results = list(pool.map(render_job, jobs))
+    for output, elapsed in results:
+        print(f"  {elapsed:6.2f}s  {output}")
+    print(f"✓ {len(results)} sunum, {workers} worker, toplam {time.perf_counter() - started:.2f}s")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manifest'teki tüm sunumları render et")
+    parser.add_argument('manifest')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help="worker sayısı")
+    args = parser.parse_args(argv)
+
+    jobs = load_manifest(args.manifest)
+    # Cache klasörleri (.pipeline_cache, .extract_cache) pipeline klasöründe tutulur
+    os.chdir(HERE)
+    run_batch(jobs, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
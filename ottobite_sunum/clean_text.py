@@ -1,4 +1,4 @@
-import re
+from fixup_engine import join_spaced_letters
 
 def clean_text(text):
     # 1. Temel satır birleştirme: Satır sonundaki tireleri ve gereksiz yeni satırları kaldır
@@ -76,16 +76,11 @@ def clean_text(text):
         # Bir harf, sonra boşluk, sonra yine bir harf geliyorsa, o boşluğu sil.
         
         # Bu desen: "K al em" -> "K" ile "a" arasını siler -> "Kal em". Sonra tekrar çalıştırırsak "Kalem" olur mu?
-        # Python re.sub soldan sağa çalışır. Tek seferde iç içe çözmeyebilir. While döngüsü ile dönmek gerekebilir.
         
-        temp_line = line
-        prev_line = ""
-        while temp_line != prev_line:
-            prev_line = temp_line
-            # Harf + Boşluk + Harf (kelime sınırları önemli değil ki "G ar" da G bir kelime gibi durabilir başta)
-            # Sadece tek harf olanları hedefleyelim.
-            # \b harf \s+ harf
-            temp_line = re.sub(r'(^|\s)([a-zA-ZçğıöşüÇĞİÖŞÜ])\s+([a-zA-ZçğıöşüÇĞİÖŞÜ])', r'\1\2\3', temp_line)
+        # Harf + Boşluk + Harf (kelime sınırları önemli değil ki "G ar" da G bir kelime gibi durabilir başta)
+        # Sadece tek harf olanları hedefleyelim. Eski while/re.sub sabit nokta
+        # döngüsüyle aynı sonuç, tek geçişte (fixup_engine.join_spaced_letters)
+        temp_line = join_spaced_letters(line)
             
         cleaned_lines.append(temp_line)
 
@@ -1,6 +1,8 @@
 # encoding: utf-8
 import re
 
+from fixup_engine import join_spaced_letters
+
 def clean_text(text):
     # 1. Genel temizlik
     lines = text.split('\n')
@@ -82,12 +84,7 @@ def clean_text(text):
         
         # O yüzden manuel listeyi zengin tuttum ve ek olarak:
         # Tek harf + Boşluk + Tek Harf -> Birleştir
-        temp_line = line
-        prev_line = ""
-        while temp_line != prev_line:
-            prev_line = temp_line
-            temp_line = re.sub(r'(^|\s)([a-zA-ZçğıöşüÇĞİÖŞÜ])\s+([a-zA-ZçğıöşüÇĞİÖŞÜ])', r'\1\2\3', temp_line)
-        line = temp_line
+        line = join_spaced_letters(line)
 
         # "l ar", "l er" eklerini birleştir
         line = re.sub(r'([a-zA-ZçğıöşüÇĞİÖŞÜ])\s+(lar|ler|nın|nin|nun|nün|yı|yi|yu|yü)\b', r'\1\2', line, flags=re.IGNORECASE)
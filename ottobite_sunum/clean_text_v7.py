@@ -1,6 +1,8 @@
 # encoding: utf-8
 import re
 
+from fixup_engine import join_letter_pairs
+
 def clean_text(text):
     lines = text.split('\n')
     cleaned_lines = []
@@ -146,22 +148,14 @@ def clean_text(text):
         # 2. Heuristik Pass (Regex'in kaçırdığı "t a k ı m" gibiler için)
         # Sadece harflerden oluşan ve aralarında boşluk olan dizileri bul.
         # r'\b([a-zA-ZçğıöşüÇĞİÖŞÜ])\s+([a-zA-ZçğıöşüÇĞİÖŞÜ])\b' -> bu 2 harf birleştirir.
-        # Bunu loop ile yaparsak: t a k ı m -> ta k ı m -> tak ı m -> takı m -> takım
+        # Loop ile: t a k ı m -> ta kı m (birleşen çift bir daha eşleşmez).
+        # Eski while/re.sub sabit nokta döngüsüyle aynı sonuç, tek geçişte.
         
-        old_line = ""
-        while old_line != line:
-            old_line = line
-            # Stop words koruması: "v e" -> "ve" olsun ama "A ve B" -> "AveB" olmasın.
-            # Regex: (Harf) (Harf)
-            # Bu regex "ve" yi de birleştirir. Zaten "ve" bitişik olmalı.
-            
-            # Risk: "o" (zamir).
-            # Metinde "o" zamiri tek başına neredeyse yok, hep kelime eki gibi duruyor "G ars on".
-            
-            # Güvenli mod: Sadece bilinen bozukluk paternleri.
-            # "b i r", "i ç i n", "k a d a r".
-            
-            line = re.sub(r'(\b[a-zA-ZçğıöşüÇĞİÖŞÜ])\s+([a-zA-ZçğıöşüÇĞİÖŞÜ]\b)', r'\1\2', line)
+        # Stop words koruması: "v e" -> "ve" olsun ama "A ve B" -> "AveB" olmasın.
+        # Bu "ve" yi de birleştirir. Zaten "ve" bitişik olmalı.
+        # Risk: "o" (zamir).
+        # Metinde "o" zamiri tek başına neredeyse yok, hep kelime eki gibi duruyor "G ars on".
+        line = join_letter_pairs(line)
             
         # Son temizlik
         line = re.sub(r'(\w)\s+([,:.;])', r'\1\2', line) # "kelime ," -> "kelime,"
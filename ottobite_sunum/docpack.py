@@ -0,0 +1,176 @@
+# encoding: utf-8
+"""
+Yapılandırılmış doküman için kompakt ikili ara format (.otbd)
+structured_data*.json (indent=2) yerine: string tablosu + paketlenmiş düğüm
+dizisi + bölüm indeksi. Okuma mmap ile; bölümler erişildikçe çözülür, 10-15.
+bölümleri isteyen renderer dokümanın geri kalanına dokunmaz.
+
+Dosya düzeni (little-endian):
+    header   HEADER: magic, versiyon, string/bölüm/düğüm sayıları, tablo offset'leri
+    strings  STRING_ENTRY * n_strings  (blob içi offset, byte uzunluğu)
+    sections SECTION_ENTRY * n_sections (başlık string id, ilk düğüm, düğüm sayısı)
+    nodes    NODE_ENTRY * n_nodes      (metin string id, tip kodu)
+    blob     UTF-8 string'ler (tekrarlayan metinler bir kez)
+
+Tip kodları TYPE_CODES sırasıdır; sıra değişirse VERSION artırılır.
+
+Kullanım:
+    from docpack import dump, load
+    dump(sections, 'structured_data_final_v7.otbd')
+    doc = load('structured_data_final_v7.otbd')
+    for section in doc[10:16]: ...
+    python docpack.py structured_data_final_v7.json   # -> .otbd
+"""
+
+import mmap
+import os
+import struct
+
+from document import NODE_TYPES, BodyText, Section
+
+MAGIC = b'OTBD'
+VERSION = 1
+
+HEADER = struct.Struct('<4sHHIIIIIII')
+STRING_ENTRY = struct.Struct('<II')
+SECTION_ENTRY = struct.Struct('<III')
+NODE_ENTRY = struct.Struct('<IB')
+
+TYPE_CODES = ('body_text', 'bullet', 'subheader', 'emphasis', 'intro_box', 'quote_box')
+TYPE_CLASSES = tuple(NODE_TYPES[name] for name in TYPE_CODES)
+CODE_OF = {name: code for code, name in enumerate(TYPE_CODES)}
+
+
+def pack(sections):
+    """Section listesi -> bytes"""
+    string_ids = {}
+    blob = bytearray()
+    string_table = bytearray()
+
+    def intern(text):
+        sid = string_ids.get(text)
+        if sid is None:
+            data = text.encode('utf-8')
+            sid = string_ids[text] = len(string_ids)
+            string_table.extend(STRING_ENTRY.pack(len(blob), len(data)))
+            blob.extend(data)
+        return sid
+
+    section_table = bytearray()
+    node_table = bytearray()
+    n_nodes = 0
+    for section in sections:
+        section_table.extend(SECTION_ENTRY.pack(intern(section.title), n_nodes, len(section.items)))
+        for item in section.items:
+            node_table.extend(NODE_ENTRY.pack(intern(item.text), CODE_OF.get(item.type, 0)))
+        n_nodes += len(section.items)
+
+    strings_off = HEADER.size
+    sections_off = strings_off + len(string_table)
+    nodes_off = sections_off + len(section_table)
+    blob_off = nodes_off + len(node_table)
+    header = HEADER.pack(MAGIC, VERSION, 0, len(string_ids), len(sections), n_nodes,
+                         strings_off, sections_off, nodes_off, blob_off)
+    return b''.join((header, string_table, section_table, node_table, blob))
+
+
+def dump(sections, path):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(pack(sections))
+    os.replace(tmp, path)
+
+
+class DocPack:
+    """
+    .otbd okuyucu; buffer bytes veya mmap olabilir.
+    doc[i] / doc[a:b] / iter(doc) -> document.Section (istenen bölümler çözülür)
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        (magic, version, _flags, self.n_strings, self.n_sections, self.n_nodes,
+         self.strings_off, self.sections_off, self.nodes_off, self.blob_off) = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("OTBD dosyası değil")
+        if version != VERSION:
+            raise ValueError(f"Desteklenmeyen OTBD versiyonu: {version} (beklenen {VERSION})")
+        self._strings = {}
+
+    def string(self, sid):
+        text = self._strings.get(sid)
+        if text is None:
+            offset, length = STRING_ENTRY.unpack_from(self.buffer, self.strings_off + sid * STRING_ENTRY.size)
+            start = self.blob_off + offset
+            text = self._strings[sid] = bytes(self.buffer[start:start + length]).decode('utf-8')
+        return text
+
+    def title(self, index):
+        """Bölüm başlığı, içeriği çözmeden"""
+        title_id, _, _ = SECTION_ENTRY.unpack_from(self.buffer, self.sections_off + index * SECTION_ENTRY.size)
+        return self.string(title_id)
+
+    def section(self, index):
+        title_id, first, count = SECTION_ENTRY.unpack_from(
+            self.buffer, self.sections_off + index * SECTION_ENTRY.size)
+        items = []
+        for text_id, code in NODE_ENTRY.iter_unpack(
+                self.buffer[self.nodes_off + first * NODE_ENTRY.size:
+                            self.nodes_off + (first + count) * NODE_ENTRY.size]):
+            cls = TYPE_CLASSES[code] if code < len(TYPE_CLASSES) else BodyText
+            items.append(cls(self.string(text_id)))
+        return Section(self.string(title_id), items)
+
+    def __len__(self):
+        return self.n_sections
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.section(i) for i in range(*index.indices(self.n_sections))]
+        if index < 0:
+            index += self.n_sections
+        if not 0 <= index < self.n_sections:
+            raise IndexError(index)
+        return self.section(index)
+
+    def __iter__(self):
+        for index in range(self.n_sections):
+            yield self.section(index)
+
+
+class MappedDocPack(DocPack):
+    """Dosyayı mmap ile açar; sadece okunan sayfalar belleğe gelir"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        super().__init__(memoryview(self._mmap))
+
+    def close(self):
+        self.buffer.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load(path):
+    return MappedDocPack(path)
+
+
+def is_docpack(path):
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+if __name__ == "__main__":
+    import sys
+    import document
+
+    for source in sys.argv[1:] or ['structured_data_final_v7.json']:
+        target = os.path.splitext(source)[0] + '.otbd'
+        dump(document.load(source), target)
+        print(f"✓ {source} ({os.path.getsize(source)} B) -> {target} ({os.path.getsize(target)} B)")
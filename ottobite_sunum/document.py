@@ -0,0 +1,150 @@
+# encoding: utf-8
+"""
+Doküman modeli - structure ve render aşamalarının ortak şeması
+structure_* çıktısı Section listesi; generator'lar aynı nesneleri doğrudan
+okur (aşamalar arasında JSON'a yazıp okuma yok, JSON sadece cache/diske).
+
+- Her içerik satırı küçük bir düğüm: Bullet, Subheader, IntroBox, Quote,
+  Emphasis, BodyText (__slots__, dict yok)
+- Section.intro / Section.main bölümleme sırasında doldurulur; slayt başına
+  [i for i in content if i['type'] == 'intro_box'] taraması yok
+- Eski dict şeması ile uyumlu: item['type'], item['text'], section['content']
+  ve from_json / to_json ile structured_data*.json dosyaları; şemada tipi
+  olmayan düğüm (Quote) JSON'da eski adıyla (json_type) yazılır
+- Diskte kompakt ikili format için: docpack.py (.otbd)
+"""
+
+import json
+
+
+class Node:
+    """Bir içerik satırı. type: JSON şemasındaki tip adı"""
+    __slots__ = ('text',)
+    type = 'body_text'
+    json_type = None  # eski JSON şemasındaki adı type'tan farklıysa
+    boxed = False  # yorum penceresine (intro kutusu) gider mi
+
+    def __init__(self, text):
+        self.text = text
+
+    def __getitem__(self, key):
+        # Eski generator'lar item['type'] / item['text'] okur
+        if key == 'type':
+            return self.json_type or self.type
+        if key == 'text':
+            return self.text
+        raise KeyError(key)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.text == other.text
+
+    def __hash__(self):
+        return hash((self.type, self.text))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.text!r})"
+
+    def to_json(self):
+        return {"type": self.json_type or self.type, "text": self.text}
+
+
+class BodyText(Node):
+    __slots__ = ()
+
+
+class Bullet(Node):
+    __slots__ = ()
+    type = 'bullet'
+
+
+class Subheader(Node):
+    __slots__ = ()
+    type = 'subheader'
+
+
+class Emphasis(Node):
+    __slots__ = ()
+    type = 'emphasis'
+
+
+class IntroBox(Node):
+    """'-' ile başlayan yorum satırı"""
+    __slots__ = ()
+    type = 'intro_box'
+    boxed = True
+
+
+class Quote(IntroBox):
+    """Tırnaklı konuşma örneği; yorum penceresinde gösterilir"""
+    __slots__ = ()
+    type = 'quote_box'
+    # Eski şemada konuşmalar da intro_box: generate_pptx_v9 / v5_enhanced yorum
+    # penceresini bununla seçer, v8'deki quote_box ise başka anlamda
+    json_type = 'intro_box'
+
+
+NODE_TYPES = {cls.type: cls for cls in (BodyText, Bullet, Subheader, Emphasis, IntroBox, Quote)}
+
+
+class Section:
+    """Başlık + içerik; intro (yorum penceresi) ve main bölümleri eklerken tutulur"""
+    __slots__ = ('title', 'items', 'intro', 'main')
+
+    def __init__(self, title, items=()):
+        self.title = title
+        self.items = []
+        self.intro = []
+        self.main = []
+        for item in items:
+            self.add(item)
+
+    def add(self, item):
+        self.items.append(item)
+        (self.intro if item.boxed else self.main).append(item)
+        return item
+
+    def __getitem__(self, key):
+        if key == 'title':
+            return self.title
+        if key == 'content':
+            return self.items
+        raise KeyError(key)
+
+    def __repr__(self):
+        return f"Section({self.title!r}, {len(self.items)} items)"
+
+    def to_json(self):
+        return {"title": self.title, "content": [item.to_json() for item in self.items]}
+
+
+def node_from_json(item):
+    return NODE_TYPES.get(item['type'], BodyText)(item['text'])
+
+
+def from_json(data):
+    """structured_data*.json listesi -> Section listesi"""
+    return [Section(s['title'], [node_from_json(item) for item in s['content']]) for s in data]
+
+
+def to_json(sections):
+    return [section.to_json() for section in sections]
+
+
+def as_sections(data):
+    """Section listesi olduğu gibi döner; eski dict listesi dönüştürülür"""
+    return [s if isinstance(s, Section) else from_json([s])[0] for s in data]
+
+
+def load(path):
+    """structured_data*.json veya docpack (.otbd) -> Section listesi"""
+    if path.endswith('.otbd'):
+        from docpack import load as load_pack
+        with load_pack(path) as doc:
+            return list(doc)
+    with open(path, 'r', encoding='utf-8') as f:
+        return from_json(json.load(f))
+
+
+def save(sections, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(to_json(sections), f, ensure_ascii=False, indent=2)
@@ -0,0 +1,118 @@
+# encoding: utf-8
+"""
+Sayfa metni için kalıcı disk cache'i
+- Belge anahtarı: PDF baytlarının SHA-256'sı + çıkarıcı versiyonu (read_pdf.EXTRACTORS
+  + çıkarıcı modülünün ve import ettiği yerel modüllerin kaynak hash'i)
+  -> manifest varsa PyPDF2 hiç açılmaz, tüm sayfalar cache'ten gelir
+- Sayfa anahtarı: sayfanın content stream + font adları hash'i + çıkarıcı versiyonu
+  -> PDF değişmişse sadece içeriği değişen sayfalar yeniden çıkarılır
+
+Yapı:
+    .extract_cache/docs/<pdf_hash>.json   {"pages": [page_key, ...]}
+    .extract_cache/pages/<page_key>.txt   sayfa metni
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+from PyPDF2 import PdfReader
+
+from fingerprint import fingerprint
+from read_pdf import EXTRACTOR_VERSION, EXTRACTORS
+
+CACHE_DIR = '.extract_cache'
+
+
+def file_hash(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def page_key(page, version=EXTRACTOR_VERSION):
+    h = hashlib.sha256(version.encode())
+    contents = page.get_contents()
+    if contents is not None:
+        h.update(contents.get_data())
+    # Aynı content stream farklı fontla farklı metin çıkarabilir
+    resources = page.get('/Resources')
+    resources = resources.get_object() if resources is not None else {}
+    fonts = resources.get('/Font')
+    fonts = fonts.get_object() if fonts is not None else {}
+    for name in sorted(fonts):
+        h.update(name.encode())
+        h.update(str(fonts[name].get_object().get('/BaseFont', '')).encode())
+    return h.hexdigest()
+
+
+def _write(path, text):
+    # Yarım yazılmış dosya cache'e girmesin
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def _read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def iter_pages_cached(pdf_path, cache_dir=CACHE_DIR, stats=None, mode='pypdf2'):
+    """
+    read_pdf.iter_pages ile aynı (page_no, text) kayıtları.
+    stats bir dict verilirse 'hit' / 'miss' sayfa sayıları yazılır.
+    mode: read_pdf.EXTRACTORS anahtarı; her modun cache'i ayrı
+    """
+    version, extract = EXTRACTORS[mode]
+    # Versiyonu elle artırmayı unutmak eski metni döndürmesin: kod değişince anahtar da değişir
+    version = f"{version}-{fingerprint(sys.modules[extract.__module__])[:16]}"
+    docs_dir = os.path.join(cache_dir, 'docs')
+    pages_dir = os.path.join(cache_dir, 'pages')
+    os.makedirs(docs_dir, exist_ok=True)
+    os.makedirs(pages_dir, exist_ok=True)
+    if stats is not None:
+        stats.setdefault('hit', 0)
+        stats.setdefault('miss', 0)
+
+    doc_key = hashlib.sha256((file_hash(pdf_path) + version).encode()).hexdigest()
+    manifest_path = os.path.join(docs_dir, doc_key + '.json')
+
+    # 1. Hızlı yol: PDF baytları aynı, PyPDF2 açılmaz
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            keys = json.load(f)['pages']
+        paths = [os.path.join(pages_dir, key + '.txt') for key in keys]
+        if all(os.path.exists(p) for p in paths):
+            for page_no, path in enumerate(paths, 1):
+                if stats is not None:
+                    stats['hit'] += 1
+                yield page_no, _read(path)
+            return
+
+    # 2. PDF değişmiş: sayfa bazında cache
+    keys = []
+    with open(pdf_path, 'rb') as f:
+        reader = PdfReader(f)
+        for i in range(len(reader.pages)):
+            page = reader.pages[i]
+            key = page_key(page, version)
+            path = os.path.join(pages_dir, key + '.txt')
+            if os.path.exists(path):
+                text = _read(path)
+                if stats is not None:
+                    stats['hit'] += 1
+            else:
+                text = extract(page)
+                _write(path, text)
+                if stats is not None:
+                    stats['miss'] += 1
+            keys.append(key)
+            yield i + 1, text
+
+    # Manifest yalnızca tüm sayfalar işlendiğinde yazılır
+    _write(manifest_path, json.dumps({'pdf': os.path.basename(pdf_path), 'pages': keys}))
@@ -0,0 +1,88 @@
+# encoding: utf-8
+"""
+Kaynak kod parmak izi - pipeline aşama anahtarları ve extract_cache için
+Modülün dosyası + import zinciriyle ulaşılan tüm yerel modüllerin (bu klasördeki
+.py dosyaları) SHA-256'sı. Import'lar AST'den okunur: "from read_pdf import
+EXTRACTORS" gibi modül nesnesi taşımayan import'lar da bulunur.
+
+Bu modül hiçbir yerel modülü import etmez: kendisini kullanan aşamaların
+anahtarına başka aşamaların kodu (ör. pipeline.run içindekiler) karışmaz.
+"""
+
+import ast
+import hashlib
+import os
+import sys
+import types
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _local_file(module):
+    path = getattr(module, '__file__', None)
+    if path and os.path.dirname(os.path.abspath(path)) == HERE:
+        return path
+    return None
+
+
+# Kaynak dosya -> ((mtime, boyut), import ettiği yerel dosyalar)
+_IMPORTS = {}
+
+
+def _is_main_guard(node):
+    return (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+            and isinstance(node.test.left, ast.Name) and node.test.left.id == '__name__')
+
+
+def _local_imports(path):
+    """
+    Dosyadaki tüm import'ların (fonksiyon içindeki gecikmeli import'lar dahil,
+    'if __name__ == "__main__"' bloğu hariç) yerel modül dosyaları. Statik:
+    "from read_pdf import EXTRACTORS" gibi modül nesnesi taşımayan import'lar da bulunur.
+    """
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _IMPORTS.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(path, 'rb') as f:
+        tree = ast.parse(f.read(), path)
+    names = set()
+    body = [node for node in tree.body if not _is_main_guard(node)]
+    for node in (child for top in body for child in ast.walk(top)):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+    files = []
+    for name in sorted(names):
+        candidate = os.path.join(HERE, name.split('.')[0] + '.py')
+        if os.path.exists(candidate):
+            files.append(candidate)
+    _IMPORTS[path] = (stamp, files)
+    return files
+
+
+def fingerprint(module):
+    """Modülün ve import zinciriyle ulaştığı tüm yerel modüllerin kaynak hash'i"""
+    pending = [_local_file(module)]
+    for value in vars(module).values():
+        if isinstance(value, types.ModuleType):
+            pending.append(_local_file(value))
+        elif getattr(value, '__module__', None) in sys.modules:
+            pending.append(_local_file(sys.modules[value.__module__]))
+    files = set()
+    while pending:
+        path = pending.pop()
+        if not path:
+            continue
+        path = os.path.abspath(path)
+        if path in files:
+            continue
+        files.add(path)
+        pending.extend(_local_imports(path))
+    h = hashlib.sha256()
+    for path in sorted(files):
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
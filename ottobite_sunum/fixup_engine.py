@@ -0,0 +1,230 @@
+# encoding: utf-8
+"""
+OTTOBITE Fixup Engine
+Replacement tablosunu (pattern, replacement) tek bir derlenmiş regex'e çevirir.
+- Her pattern kendi named group'u içinde bir alternation dalı olur
+- Dallar ilk harflerine göre gruplanır, her grubun önünde tek karakterlik
+  lookahead vardır; bir pozisyonda yalnızca o harfle başlayan dallar denenir
+- Eşleşen dal m.lastgroup ile dispatch tablosundan bulunur
+- Satır tek seferde taranır (pattern başına ayrı re.sub yok)
+
+Not: Sıralı re.sub zincirinden farkı, bir düzeltmenin çıktısının sonraki
+pattern'e tekrar girmemesidir. Aynı pozisyonda birden fazla dal eşleşirse
+tablodaki ilk dal kazanır, bu yüzden uzun pattern'ler önce yazılmalı.
+"""
+
+import re
+
+# Pattern başında atlanabilen sıfır genişlikli ifadeler
+_ZERO_WIDTH_PREFIXES = (r'\b', '^')
+
+
+def _first_literal(pattern):
+    """Pattern'in eşleşmeye başlayacağı sabit karakter, yoksa None"""
+    for prefix in _ZERO_WIDTH_PREFIXES:
+        if pattern.startswith(prefix):
+            pattern = pattern[len(prefix):]
+    if not pattern or pattern[0] in '\\.^$*+?{}[]|()':
+        return None
+    # "ab?" gibi ilk karakteri opsiyonel pattern'ler
+    if len(pattern) > 1 and pattern[1] in '*?{':
+        return None
+    return pattern[0]
+
+
+class FixupEngine:
+    def __init__(self, replacements, flags=re.IGNORECASE):
+        self.dispatch = {}
+        groups = {}  # ilk harf -> [(ilk karakter, dal)], ekleme sırası korunur
+        for idx, (pattern, replacement) in enumerate(replacements):
+            name = f"_{idx}"
+            # Dal içindeki grupları numaralı bırakırsak \1 gibi referanslar kayar
+            if re.compile(pattern).groups:
+                raise ValueError(f"Pattern grup içeremez: {pattern!r}")
+            first = _first_literal(pattern)
+            key = first.lower() if first else None
+            groups.setdefault(key, []).append((first, f"(?P<{name}>{pattern})"))
+            self.dispatch[name] = replacement
+
+        parts = []
+        for key, members in groups.items():
+            body = "|".join(branch for _, branch in members)
+            if key is None:
+                parts.append(body)
+            else:
+                chars = "".join(sorted({re.escape(first) for first, _ in members}))
+                parts.append(f"(?=[{chars}])(?:{body})")
+        self.regex = re.compile("|".join(parts), flags) if parts else None
+
+    def _replace(self, match):
+        return self.dispatch[match.lastgroup]
+
+    def apply(self, line):
+        if self.regex is None:
+            return line
+        return self.regex.sub(self._replace, line)
+
+
+class SuffixMerger:
+    """
+    Word + Space + Suffix -> WordSuffix. clean_text_v9'daki
+        for s in SUFFIXES: re.sub(r'(\\w)\\s+(' + s + r')\\b', r'\\1\\2', line)
+    zinciriyle birebir aynı sonuç, satır tek regex taramasıyla:
+    - Aday boşluklar tek finditer ile bulunur; m.lastindex eşleşen ek, o ekle
+      IGNORECASE'te denk eklerin ('sı' / 'si') geçişleri self.passes'ta
+    - (geçiş, konum) olayları sırayla karara bağlanır; zincirdeki iki
+      etkileşim de komşuya bakarak çözülür:
+      * sağdaki boşluk daha önceki bir geçişte birleştiyse ek artık kelime
+        sonunda değil (\\b bozuldu): "afiri iz ler" -> 'ler' önce, "afiri izler"
+      * soldaki komşu aynı geçişte birleştiyse (\\w) onun eşleşmesinde
+        tüketildi: "a el el" -> "ael el" (denk bir ekin sonraki geçişi yine dener)
+    Birleştirme yeni bir ek oluşturamasın diye (ör. 't' + 'me' -> 'tme') bir ek,
+    listede kendisinden önce gelen başka bir ekle bitemez; __init__ kontrol eder.
+    """
+
+    def __init__(self, suffixes, flags=re.IGNORECASE):
+        for i, suffix in enumerate(suffixes):
+            for earlier in suffixes[:i]:
+                if len(earlier) < len(suffix) and re.fullmatch(re.escape(earlier), suffix[-len(earlier):], flags):
+                    raise ValueError(f"'{suffix}' kendinden önceki '{earlier}' ekiyle bitiyor; "
+                                     f"sıralı zincirle aynı sonuç garanti edilemez")
+        self.candidates = re.compile(
+            r'(?<=\w)\s+(?:' + '|'.join(f'({re.escape(s)})' for s in suffixes) + r')\b', flags)
+        # Grup no -> aynı metni eşleyen tüm eklerin geçişleri ('sı' ve 'si' IGNORECASE'te denk)
+        self.passes = {
+            i: [j for j, other in enumerate(suffixes, 1) if re.fullmatch(re.escape(other), suffix, flags)]
+            for i, suffix in enumerate(suffixes, 1)
+        }
+
+    def merge(self, line):
+        matches = list(self.candidates.finditer(line))
+        if not matches:
+            return line
+        n = len(matches)
+        merged = [0] * n  # birleştiği geçiş, 0: birleşmedi
+        events = sorted((k, i) for i, m in enumerate(matches) for k in self.passes[m.lastindex])
+        for k, i in events:
+            if merged[i]:
+                continue
+            m = matches[i]
+            # Sağ komşu bu ekin hemen ardında ve önceki bir geçişte birleşti: ek kelime sonunda değil
+            if i + 1 < n and merged[i + 1] and matches[i + 1].start() == m.end():
+                continue
+            # Sol komşu aynı geçişte bu boşluğun hemen önünde birleşti: (\w) tüketildi
+            if i and merged[i - 1] == k and matches[i - 1].end() == m.start():
+                continue
+            merged[i] = k
+        out = []
+        pos = 0
+        for m, ok in zip(matches, merged):
+            if ok:
+                out.append(line[pos:m.start()])
+                pos = m.start(m.lastindex)
+        out.append(line[pos:])
+        return ''.join(out)
+
+
+def compile_suffix_merger(suffixes, flags=re.IGNORECASE):
+    """Kullanım: merger.merge(line)"""
+    return SuffixMerger(suffixes, flags)
+
+
+# Eski cleaner'ların "tek harf" sınıfı (â, î gibi harfler dahil değil)
+SPACED_LETTERS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZçğıöşüÇĞİÖŞÜ')
+_WHITESPACE_SPLIT = re.compile(r'(\s+)')
+
+
+def join_spaced_letters(line):
+    """
+    Tek harflik token'ı sonraki harfle başlayan token'a yapıştırır:
+    "G ar s on" -> "Gar son". clean_text.py / v2'deki
+        while değişiyor: re.sub(r'(^|\\s)([L])\\s+([L])', r'\\1\\2\\3', line)
+    döngüsünün sabit noktasıyla aynı sonuç, token akışında tek geçiş: O(n).
+    Birleşen token en az 2 harf olur, bir daha sol taraf olamaz; bu yüzden
+    soldan sağa bir kez bakmak yeterli.
+    """
+    parts = _WHITESPACE_SPLIT.split(line)
+    out = [parts[0]]
+    for i in range(1, len(parts) - 1, 2):
+        token = parts[i + 1]
+        prev = out[-1]
+        if len(prev) == 1 and prev in SPACED_LETTERS and token[:1] in SPACED_LETTERS:
+            out[-1] = prev + token
+        else:
+            out.append(parts[i])
+            out.append(token)
+    return ''.join(out)
+
+
+def join_letter_pairs(line):
+    """
+    Tek karakterlik iki kelimeyi birleştirir: "t a k ı m" -> "ta kı m".
+    clean_text_v7.py'deki
+        while değişiyor: re.sub(r'(\\b[L])\\s+([L]\\b)', r'\\1\\2', line)
+    döngüsünün sabit noktasıyla aynı sonuç, token akışında tek geçiş: O(n).
+    Birleşen çift iki karakterlik kelime olur, bir daha eşleşemez.
+    Sol: token'ın son karakteri harf ve önünde kelime karakteri yok;
+    sağ: sonraki token'ın ilk karakteri harf ve ardında kelime karakteri yok.
+    """
+    parts = _WHITESPACE_SPLIT.split(line)
+    out = [parts[0]]
+    for i in range(1, len(parts) - 1, 2):
+        token = parts[i + 1]
+        prev = out[-1]
+        # \w ile aynı tanım: isalnum() veya '_'
+        if (prev[-1:] in SPACED_LETTERS and token[:1] in SPACED_LETTERS
+                and (len(prev) == 1 or not (prev[-2].isalnum() or prev[-2] == '_'))
+                and (len(token) == 1 or not (token[1].isalnum() or token[1] == '_'))):
+            out[-1] = prev + token
+        else:
+            out.append(parts[i])
+            out.append(token)
+    return ''.join(out)
+
+
+if __name__ == "__main__":
+    # Benchmark: tek harflerden oluşan uzun satırda sabit nokta döngüsü vs tek geçiş
+    import random
+    import timeit
+
+    def fixed_point(pattern, replacement, line):
+        prev = None
+        while line != prev:
+            prev = line
+            line = pattern.sub(replacement, line)
+        return line
+
+    CASES = [
+        ('clean_text.py', re.compile(r'(^|\s)([a-zA-ZçğıöşüÇĞİÖŞÜ])\s+([a-zA-ZçğıöşüÇĞİÖŞÜ])'), r'\1\2\3',
+         join_spaced_letters),
+        ('clean_text_v7.py', re.compile(r'(\b[a-zA-ZçğıöşüÇĞİÖŞÜ])\s+([a-zA-ZçğıöşüÇĞİÖŞÜ]\b)'), r'\1\2',
+         join_letter_pairs),
+    ]
+    random.seed(0)
+    for n in (1000, 10000, 100000):
+        line = ' '.join(random.choice('abcçdeğıiklmnoösştuüyz') for _ in range(n))
+        for name, pattern, replacement, merge in CASES:
+            assert merge(line) == fixed_point(pattern, replacement, line)
+            loop = min(timeit.repeat(lambda: fixed_point(pattern, replacement, line), number=3, repeat=5)) / 3
+            single = min(timeit.repeat(lambda: merge(line), number=3, repeat=5)) / 3
+            print(f"  {n:>6} harf  {name:<17} döngü {loop * 1e3:7.2f}ms  tek geçiş {single * 1e3:7.2f}ms  x{loop / single:.1f}")
+
+    # Ek birleştirme: eski sıralı re.sub zinciriyle birebir aynı olmalı
+    from clean_text_v9 import SUFFIXES, SUFFIX_MERGER
+
+    def sequential(line):
+        for s in SUFFIXES:
+            line = re.sub(r'(\w)\s+(' + s + r')\b', r'\1\2', line, flags=re.IGNORECASE)
+        return line
+
+    with open('full_content.txt', 'r', encoding='utf-8') as f:
+        lines = [line.strip() for line in f]
+    lines += ['mis afiri iz ler', 'Sesyüks el tme', 'a el el', 'x t me', 'KAPI İZ LER', 'a\tSI, su']
+    pool = SUFFIXES + [s.upper() for s in SUFFIXES] + ['ev', 'kapı', 'masa', 't', 'İz', 'SI', ',', 'el,']
+    # Rastgele satırlar: büyük/küçük harf denk ekler ('sı' / 'SI' / 'si') aynı boşluğu birden çok geçişte dener
+    lines += [random.choice([' ', '  ', '\t']).join(random.choice(pool) for _ in range(random.randint(2, 12)))
+              for _ in range(5000)]
+    assert all(SUFFIX_MERGER.merge(line) == sequential(line) for line in lines)
+    old = min(timeit.repeat(lambda: [sequential(line) for line in lines], number=3, repeat=5)) / 3
+    new = min(timeit.repeat(lambda: [SUFFIX_MERGER.merge(line) for line in lines], number=3, repeat=5)) / 3
+    print(f"  {len(lines):>6} satır ekler           sıralı {old * 1e3:7.2f}ms  tek tarama {new * 1e3:7.2f}ms  x{old / new:.1f}")
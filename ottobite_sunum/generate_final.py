@@ -12,6 +12,10 @@ from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 
+from document import Section, as_sections
+from paginate import paginate
+from slide_master import build_layouts, set_title
+
 # Colors
 BRICK_RED = RGBColor(192, 57, 43)
 DARK_GRAY = RGBColor(44, 62, 80)
@@ -19,16 +23,27 @@ LIGHT_BG = RGBColor(245, 247, 250)
 BORDER_COLOR = RGBColor(215, 215, 215)
 FOOTER_GRAY = RGBColor(150, 150, 150)
 
-def create_presentation():
+def create_presentation(slides_data=None, output_path="OTTOBITE_SUNUM_FINAL.pptx"):
     prs = Presentation()
     
-    with open('structured_data_perfect.json', 'r', encoding='utf-8') as f:
-        slides_data = json.load(f)
+    if slides_data is None:
+        with open('structured_data_perfect.json', 'r', encoding='utf-8') as f:
+            slides_data = json.load(f)
+    sections = as_sections(slides_data)
+    
+    # Title style and footer live in the content layout
+    layouts = build_layouts(
+        prs,
+        title=dict(left=Inches(0.5), top=Inches(0.7), width=Inches(9), height=Inches(0.6),
+                   size=30, color=BRICK_RED, font="Arial"),
+        footer=dict(left=Inches(8), top=Inches(7.1), width=Inches(2), height=Inches(0.3),
+                    text="OTTOBITE 2026", size=10, color=FOOTER_GRAY),
+    )
     
     # ==========================================
     # TITLE SLIDE
     # ==========================================
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = prs.slides.add_slide(layouts['blank'])
     
     txBox = slide.shapes.add_textbox(Inches(1), Inches(2.5), Inches(8), Inches(1))
     p = txBox.text_frame.add_paragraph()
@@ -61,28 +76,21 @@ def create_presentation():
     def estimate_lines(items):
         total = 0
         for item in items:
-            text_len = len(item['text'])
+            text_len = len(item.text)
             lines = max(1, math.ceil(text_len / 70))
-            if item['type'] == 'subheader':
+            if item.type == 'subheader':
                 lines += 0.5
-            elif item['type'] == 'intro_box':
+            elif item.boxed:
                 lines += 0.3
             total += lines
         return total
     
-    def add_slide(prs, title, content, is_continuation=False):
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+    def add_slide(prs, title, intro_items, main_items, is_continuation=False):
+        slide = prs.slides.add_slide(layouts['content'])
         
         # Title
         display_title = f"{title} (Devam)" if is_continuation else title
-        
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.4), Inches(9), Inches(1))
-        tp = title_box.text_frame.add_paragraph()
-        tp.text = display_title
-        tp.font.size = Pt(30)
-        tp.font.bold = True
-        tp.font.color.rgb = BRICK_RED
-        tp.font.name = "Arial"
+        set_title(slide, display_title)
         
         # Dynamic separator line
         char_count = len(display_title)
@@ -97,15 +105,11 @@ def create_presentation():
         line.fill.fore_color.rgb = BRICK_RED
         line.line.fill.background()
         
-        # Separate intro_box from rest
-        intro_items = [i for i in content if i['type'] == 'intro_box']
-        main_items = [i for i in content if i['type'] != 'intro_box']
-        
         current_top = 1.5
         
         # Comment window for intro items
         if intro_items:
-            total_chars = sum(len(i['text']) for i in intro_items)
+            total_chars = sum(len(i.text) for i in intro_items)
             num_items = len(intro_items)
             est_lines = max(num_items, math.ceil(total_chars / 80))
             box_height = min(1.5, max(0.5, est_lines * 0.25 + 0.2))
@@ -129,7 +133,7 @@ def create_presentation():
             
             for idx, item in enumerate(intro_items):
                 p = tf.add_paragraph()
-                p.text = item['text']
+                p.text = item.text
                 p.font.size = Pt(14)
                 p.font.italic = True
                 p.font.color.rgb = RGBColor(60, 60, 60)
@@ -159,8 +163,8 @@ def create_presentation():
             tf.vertical_anchor = MSO_ANCHOR.TOP
             
             for item in main_items:
-                text_val = item['text']
-                item_type = item['type']
+                text_val = item.text
+                item_type = item.type
                 
                 p = tf.add_paragraph()
                 p.font.name = "Calibri"
@@ -192,62 +196,27 @@ def create_presentation():
                     p.font.size = Pt(font_size)
                     p.font.color.rgb = DARK_GRAY
                     p.space_after = Pt(4)
-        
-        # Footer
-        footer_box = slide.shapes.add_textbox(Inches(8), Inches(7.1), Inches(2), Inches(0.5))
-        fp = footer_box.text_frame.add_paragraph()
-        fp.text = "OTTOBITE 2026"
-        fp.font.size = Pt(10)
-        fp.font.color.rgb = FOOTER_GRAY
-        fp.alignment = PP_ALIGN.RIGHT
     
     # Process slides
-    for slide_info in slides_data:
-        if len(slide_info['content']) == 0:
+    for section in sections:
+        if len(section.items) == 0:
             continue
         
         # Skip intro duplicate
-        if slide_info['title'] == "OTTOBITE Garson Rehberi":
+        if section.title == "OTTOBITE Garson Rehberi":
             continue
         
-        title = slide_info['title']
-        all_content = slide_info['content']
-        
-        total_lines = estimate_lines(all_content)
+        title = section.title
         
-        if total_lines <= MAX_LINES:
-            add_slide(prs, title, all_content, is_continuation=False)
-        else:
-            # Split content
-            chunks = []
-            current_chunk = []
-            current_lines = 0
-            
-            for item in all_content:
-                text_len = len(item['text'])
-                item_lines = max(1, math.ceil(text_len / 70))
-                if item['type'] == 'subheader':
-                    item_lines += 0.5
-                
-                if current_lines + item_lines > MAX_LINES and current_chunk:
-                    chunks.append(current_chunk)
-                    current_chunk = []
-                    current_lines = 0
-                
-                current_chunk.append(item)
-                current_lines += item_lines
-            
-            if current_chunk:
-                chunks.append(current_chunk)
-            
-            for idx, chunk in enumerate(chunks):
-                add_slide(prs, title, chunk, is_continuation=(idx > 0))
+        chunks = paginate(section.items, lambda item: estimate_lines([item]), MAX_LINES)
+        for idx, chunk in enumerate(chunks):
+            part = section if len(chunks) == 1 else Section(title, chunk)
+            add_slide(prs, title, part.intro, part.main, is_continuation=(idx > 0))
     
     # Save
-    output = "OTTOBITE_SUNUM_FINAL.pptx"
-    prs.save(output)
-    print(f"✓ Final presentation saved: {output}")
-    return output
+    prs.save(output_path)
+    print(f"✓ Final presentation saved: {output_path}")
+    return output_path
 
 if __name__ == "__main__":
     create_presentation()
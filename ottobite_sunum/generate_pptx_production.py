@@ -3,15 +3,36 @@
 OTTOBITE Presentation Generator - Production Ready V11
 Features:
 - Content overflow: Splits into multiple slides (not shrink to unreadable)
+  at optimal break points (paginate.py)
 - Proportional separator lines
 - Professional comment windows
 - Perfect Turkish text
 - 100% content visibility
+- Incremental rebuild: unchanged sections reuse cached slide XML
+- Title style and footer live in the slide layout; the separator is cloned per slide
 """
 
+import copy
+import functools
+import hashlib
 import json
-import math
+import os
+import sys
 from pptx import Presentation
+from pptx.oxml import parse_xml
+from lxml import etree
+from pptx.oxml.ns import qn
+
+import document
+import paginate as paginate_module
+import slide_master
+import text_metrics
+import themes
+from document import Section, as_sections
+from paginate import paginate
+from slide_master import build_layouts, set_title
+from text_metrics import wrapped_lines, box_width
+from themes import bind_scheme, scheme_bound
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
@@ -40,18 +61,137 @@ SLIDE_WIDTH = 10.0
 CONTENT_LEFT = 0.5
 CONTENT_WIDTH = 9.0
 
-def create_presentation():
+# Usable line widths (pt) for the main text box and the comment window
+MAIN_TEXT_WIDTH = box_width(CONTENT_WIDTH)
+COMMENT_TEXT_WIDTH = CONTENT_WIDTH * 72.0 - 2 * 0.2 * 72.0
+
+
+def measure_item_lines(item):
+    """Wrapped line count of one content item, measured with the real font"""
+    text = item.text
+    item_type = item.type
+    if item.boxed:
+        return wrapped_lines(text, 'Calibri', COMMENT_SIZE, COMMENT_TEXT_WIDTH)
+    if item_type == 'subheader':
+        return wrapped_lines(text, 'Calibri', SUBHEADER_SIZE, MAIN_TEXT_WIDTH, bold=True)
+    if item_type == 'bullet':
+        return wrapped_lines("• " + text, 'Calibri', BULLET_SIZE, MAIN_TEXT_WIDTH)
+    if item_type == 'emphasis':
+        return wrapped_lines(text.upper(), 'Calibri', EMPHASIS_SIZE, MAIN_TEXT_WIDTH, bold=True)
+    return wrapped_lines(text, 'Calibri', BODY_SIZE, MAIN_TEXT_WIDTH)
+
+
+# Incremental build
+SLIDE_CACHE_DIR = '.slide_cache'
+
+# Slide XML depends on this file and on the local modules it renders with
+# (pagination, text measurement, layouts, theme binding, document model),
+# plus the font files text_metrics measures with; all of them go into the key
+RENDERER_MODULES = (document, paginate_module, slide_master, text_metrics, themes)
+
+
+@functools.lru_cache(maxsize=None)
+def renderer_hash():
+    h = hashlib.sha256()
+    for path in [__file__] + [module.__file__ for module in RENDERER_MODULES]:
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    for name, bold in sorted(text_metrics.FONT_FILES):
+        font_path = text_metrics.find_font_file(name, bold)
+        size = os.path.getsize(font_path) if font_path else ''
+        h.update(f"{name}|{bold}|{font_path}|{size}".encode('utf-8'))
+    return h.hexdigest()
+
+
+def section_fingerprint(section):
+    """Title + content items + renderer_hash() + active palette (themes.applied)"""
+    palette = '|'.join(str(c) for c in (BRICK_RED, DARK_GRAY, LIGHT_BG, BORDER_COLOR, FOOTER_GRAY))
+    payload = json.dumps(section.to_json(), ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256((renderer_hash() + palette + payload).encode('utf-8')).hexdigest()
+
+
+def load_cached_section(cache_dir, key):
+    path = os.path.join(cache_dir, key + '.json')
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def store_cached_section(cache_dir, key, slides):
+    """Saves each slide's shape tree; content slides have no images/rels"""
+    os.makedirs(cache_dir, exist_ok=True)
+    trees = [etree.tostring(slide.shapes._spTree, encoding='unicode') for slide in slides]
+    tmp = os.path.join(cache_dir, f"{key}.json.{os.getpid()}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(trees, f)
+    os.replace(tmp, os.path.join(cache_dir, key + '.json'))
+
+
+def add_cached_slide(prs, sp_tree_xml, layout):
+    slide = prs.slides.add_slide(layout)
+    old_tree = slide.shapes._spTree
+    old_tree.getparent().replace(old_tree, parse_xml(sp_tree_xml))
+    return slide
+
+
+# Separator prototypes, one per active palette (themes.applied)
+_SEPARATOR = {}
+
+
+def separator_prototype():
+    """Separator bar drawn once with python-pptx; content slides deep-copy
+    it and only write its width"""
+    key = str(BRICK_RED)
+    if key not in _SEPARATOR:
+        scratch = Presentation()
+        slide = scratch.slides.add_slide(scratch.slide_layouts[6])
+        separator = slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE,
+            Inches(CONTENT_LEFT), Inches(1.15),
+            Inches(CONTENT_WIDTH), Pt(3)
+        )
+        separator.fill.solid()
+        separator.fill.fore_color.rgb = BRICK_RED
+        separator.line.fill.background()
+        _SEPARATOR[key] = separator._element
+    return _SEPARATOR[key]
+
+
+def add_chrome_shape(slide, prototype):
+    """Appends a copy of a prototype shape with a fresh shape id"""
+    element = copy.deepcopy(prototype)
+    element[0].find(qn('p:cNvPr')).set('id', str(slide.shapes._next_shape_id))
+    slide.shapes._spTree.insert_element_before(element, 'p:extLst')
+    return element
+
+
+@scheme_bound
+def create_presentation(slides_data=None, output_path="OTTOBITE_SUNUM_PRODUCTION.pptx",
+                        slide_cache_dir=None):
     prs = Presentation()
     prs.slide_width = Inches(SLIDE_WIDTH)
     prs.slide_height = Inches(7.5)
     
-    with open('structured_data_final_v7.json', 'r', encoding='utf-8') as f:
-        slides_data = json.load(f)
+    if slides_data is None:
+        with open('structured_data_final_v7.json', 'r', encoding='utf-8') as f:
+            slides_data = json.load(f)
+    sections = as_sections(slides_data)
+    
+    # Title style and footer are written once into the content layout
+    layouts = build_layouts(
+        prs,
+        title=dict(left=Inches(CONTENT_LEFT), top=Inches(0.6),
+                   width=Inches(CONTENT_WIDTH), height=Inches(0.55),
+                   size=TITLE_SIZE, color=BRICK_RED, font="Arial"),
+        footer=dict(left=Inches(8.3), top=Inches(7.25), width=Inches(1.5), height=Inches(0.25),
+                    text="OTTOBITE 2026", size=9, color=FOOTER_GRAY, font="Calibri"),
+    )
     
     # ==========================================
     # TITLE SLIDE
     # ==========================================
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = prs.slides.add_slide(layouts['blank'])
     
     # Main title
     txBox = slide.shapes.add_textbox(Inches(1), Inches(2.3), Inches(8), Inches(1))
@@ -87,58 +227,32 @@ def create_presentation():
     # ==========================================
     def estimate_lines(item):
         """Estimate how many lines an item will take"""
-        text_len = len(item['text'])
-        chars_per_line = 75
-        lines = max(1, math.ceil(text_len / chars_per_line))
+        lines = measure_item_lines(item)
         
-        if item['type'] == 'subheader':
+        if item.type == 'subheader':
             lines += 0.5  # Extra spacing
-        elif item['type'] == 'intro_box':
+        elif item.boxed:
             lines += 0.3
         
         return lines
     
-    def add_content_slide(prs, title, content_items, is_continuation=False):
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+    def add_content_slide(prs, title, intro_items, main_items, is_continuation=False):
+        slide = prs.slides.add_slide(layouts['content'])
         
-        # Title
+        # Title (layout placeholder) + dynamic separator line (proportional to title)
         display_title = f"{title} (Devam)" if is_continuation else title
+        set_title(slide, display_title)
         
-        title_box = slide.shapes.add_textbox(
-            Inches(CONTENT_LEFT), Inches(0.35),
-            Inches(CONTENT_WIDTH), Inches(0.8)
-        )
-        tp = title_box.text_frame.add_paragraph()
-        tp.text = display_title
-        tp.font.size = Pt(TITLE_SIZE)
-        tp.font.bold = True
-        tp.font.color.rgb = BRICK_RED
-        tp.font.name = "Arial"
-        
-        # Dynamic separator line (proportional to title)
         char_count = len(display_title)
         line_width = min(CONTENT_WIDTH, max(1.5, char_count * 0.18))
-        
-        separator = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(CONTENT_LEFT), Inches(1.15),
-            Inches(line_width), Pt(3)
-        )
-        separator.fill.solid()
-        separator.fill.fore_color.rgb = BRICK_RED
-        separator.line.fill.background()
-        
-        # Separate intro items from main content
-        intro_items = [i for i in content_items if i['type'] == 'intro_box']
-        main_items = [i for i in content_items if i['type'] != 'intro_box']
+        separator_el = add_chrome_shape(slide, separator_prototype())
+        separator_el.find('.//' + qn('a:ext')).set('cx', str(Inches(line_width)))
         
         current_top = 1.4
         
         # Comment window for intro items
         if intro_items:
-            total_intro_chars = sum(len(i['text']) for i in intro_items)
-            num_intro = len(intro_items)
-            est_lines = max(num_intro, math.ceil(total_intro_chars / 80))
+            est_lines = sum(measure_item_lines(i) for i in intro_items)
             box_height = min(1.6, max(0.5, est_lines * 0.28 + 0.25))
             
             comment_box = slide.shapes.add_shape(
@@ -161,7 +275,7 @@ def create_presentation():
             
             for idx, item in enumerate(intro_items):
                 p = tf.add_paragraph()
-                p.text = item['text']
+                p.text = item.text
                 p.font.size = Pt(COMMENT_SIZE)
                 p.font.italic = True
                 p.font.color.rgb = RGBColor(60, 60, 60)
@@ -184,8 +298,8 @@ def create_presentation():
             tf.vertical_anchor = MSO_ANCHOR.TOP
             
             for item in main_items:
-                text_val = item['text']
-                item_type = item['type']
+                text_val = item.text
+                item_type = item.type
                 
                 p = tf.add_paragraph()
                 p.font.name = "Calibri"
@@ -217,64 +331,56 @@ def create_presentation():
                     p.font.size = Pt(BODY_SIZE)
                     p.font.color.rgb = DARK_GRAY
                     p.space_after = Pt(6)
-        
-        # Footer
-        footer_box = slide.shapes.add_textbox(
-            Inches(8.3), Inches(7.0),
-            Inches(1.5), Inches(0.4)
-        )
-        fp = footer_box.text_frame.add_paragraph()
-        fp.text = "OTTOBITE 2026"
-        fp.font.size = Pt(9)
-        fp.font.color.rgb = FOOTER_GRAY
-        fp.alignment = PP_ALIGN.RIGHT
-        fp.font.name = "Calibri"
     
     # Process each slide
-    for slide_info in slides_data:
-        if len(slide_info['content']) == 0:
+    rendered = reused = 0
+    for section in sections:
+        if len(section.items) == 0:
             continue
-        if slide_info['title'] == "OTTOBITE Garson Rehberi" and len(slide_info['content']) < 3:
+        if section.title == "OTTOBITE Garson Rehberi" and len(section.items) < 3:
             continue
         
-        title = slide_info['title']
-        all_content = slide_info['content']
+        title = section.title
         
-        # Calculate total lines
-        total_lines = sum(estimate_lines(item) for item in all_content)
+        # Incremental mode: reuse the slides rendered for an identical section
+        if slide_cache_dir:
+            key = section_fingerprint(section)
+            cached_trees = load_cached_section(slide_cache_dir, key)
+            if cached_trees is not None:
+                for sp_tree_xml in cached_trees:
+                    add_cached_slide(prs, sp_tree_xml, layouts['content'])
+                reused += 1
+                continue
+            first_slide = len(prs.slides)
         
-        if total_lines <= MAX_CONTENT_LINES:
-            # Fits on one slide
-            add_content_slide(prs, title, all_content, is_continuation=False)
-        else:
-            # Need to split
-            chunks = []
-            current_chunk = []
-            current_lines = 0
-            
-            for item in all_content:
-                item_lines = estimate_lines(item)
-                
-                if current_lines + item_lines > MAX_CONTENT_LINES and current_chunk:
-                    chunks.append(current_chunk)
-                    current_chunk = []
-                    current_lines = 0
-                
-                current_chunk.append(item)
-                current_lines += item_lines
-            
-            if current_chunk:
-                chunks.append(current_chunk)
-            
-            # Create slides for each chunk
-            for idx, chunk in enumerate(chunks):
-                add_content_slide(prs, title, chunk, is_continuation=(idx > 0))
+        # Taşan bölüm: kırılma noktaları DP ile (dengeli doluluk, yetim alt başlık yok)
+        # A section that fits keeps the intro/main partition built by the structurer
+        chunks = paginate(section.items, estimate_lines, MAX_CONTENT_LINES)
+        for idx, chunk in enumerate(chunks):
+            part = section if len(chunks) == 1 else Section(title, chunk)
+            add_content_slide(prs, title, part.intro, part.main, is_continuation=(idx > 0))
+        
+        if slide_cache_dir:
+            store_cached_section(slide_cache_dir, key, list(prs.slides)[first_slide:])
+            rendered += 1
+    
+    # Palette -> theme color slots (retheme.py swaps only ppt/theme/theme1.xml)
+    bind_scheme(prs, sys.modules[__name__], 'generate_pptx_production')
     
     # Save
-    output_path = "OTTOBITE_SUNUM_PRODUCTION.pptx"
     prs.save(output_path)
+    if slide_cache_dir:
+        print(f"  Sections: {rendered} rendered, {reused} reused from {slide_cache_dir}")
     print(f"✓ Production-ready presentation saved: {output_path}")
     return output_path
 
+
+def create_presentation_incremental(slides_data=None, output_path="OTTOBITE_SUNUM_PRODUCTION.pptx"):
+    return create_presentation(slides_data, output_path, slide_cache_dir=SLIDE_CACHE_DIR)
+
+
 if __name__ == "__main__":
-    create_presentation()
+    if '--incremental' in sys.argv:
+        create_presentation_incremental()
+    else:
+        create_presentation()
@@ -1,6 +1,5 @@
 # encoding: utf-8
 import json
-import math
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
@@ -8,7 +7,14 @@ from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.text import MSO_ANCHOR
 
-def create_presentation():
+from document import as_sections
+from slide_master import build_layouts, set_title
+from text_metrics import wrapped_lines, box_width, width_profile, profile_lines, largest_fitting_size
+
+# Content text box is 9 inches wide
+CONTENT_TEXT_WIDTH = box_width(9.0)
+
+def create_presentation(slides_data=None, output_path="OTTOBITE_Sunum_FINAL.pptx"):
     prs = Presentation()
     
     # Professional Color Palette
@@ -18,52 +24,60 @@ def create_presentation():
     BORDER_COLOR = RGBColor(220, 220, 220) # Subtle borders
     FOOTER_GRAY = RGBColor(150, 150, 150)  # Footer text
     
-    with open('structured_data_final_v7.json', 'r', encoding='utf-8') as f:
-        slides_data = json.load(f)
+    if slides_data is None:
+        with open('structured_data_final_v7.json', 'r', encoding='utf-8') as f:
+            slides_data = json.load(f)
+    sections = as_sections(slides_data)
 
     # --- Enhanced Auto-Fit Algorithm ---
     def fit_text_content(tf, content_items, max_height_inches=5.5):
         """
         Intelligently scales font size to fit content within available space.
-        Uses character count and line wrapping estimation.
+        Uses real font metrics (text_metrics) for line wrapping and a
+        binary search over the point-size range instead of a fixed size list.
         """
-        sizes = [20, 18, 16, 15, 14, 13, 12, 11]
-        selected_size = 11  # Safe fallback
+        # Width profiles are computed once per item; each candidate size only rescales them
+        profiles = []
+        for item in content_items:
+            text = item.text
+            if item.type == 'subheader':
+                profiles.append((item.type, width_profile(text, 'Calibri', bold=True)))
+            elif item.type == 'bullet':
+                profiles.append((item.type, width_profile("• " + text, 'Calibri')))
+            elif item.type == 'emphasis':
+                profiles.append((item.type, width_profile(text.upper(), 'Calibri', bold=True)))
+            else:
+                profiles.append((item.type, width_profile(text, 'Calibri')))
         
-        for size in sizes:
+        def content_height(size):
+            """Total height (inches) of all items at the given body size"""
             line_height = size * 1.25
             base_spacing = max(3, size * 0.3)
             total_points = 0
             
-            for item in content_items:
-                text = item['text']
-                # Estimate characters per line (9 inches ≈ 648 points)
-                chars_per_line = int(900 / (0.52 * size))
-                
-                # Calculate wrapped lines
-                lines_needed = max(1, math.ceil(len(text) / chars_per_line))
-                
-                # Calculate item height with type-specific spacing
-                item_height = lines_needed * line_height
-                
-                if item['type'] == 'subheader':
+            for item_type, profile in profiles:
+                # Wrapped lines in the font/size the item is rendered in,
+                # plus type-specific spacing
+                if item_type == 'subheader':
+                    item_height = profile_lines(profile, min(size + 3, 22), CONTENT_TEXT_WIDTH) * line_height
                     item_height += size * 1.2  # Extra space before
-                elif item['type'] == 'emphasis':
+                elif item_type == 'emphasis':
+                    item_height = profile_lines(profile, size + 1, CONTENT_TEXT_WIDTH) * line_height
                     item_height += size * 0.8
+                else:
+                    item_height = profile_lines(profile, size, CONTENT_TEXT_WIDTH) * line_height
                 
-                item_height += base_spacing
-                total_points += item_height
+                total_points += item_height + base_spacing
             
-            # Convert to inches and check if it fits
-            total_inches = total_points / 72.0
-            if total_inches <= max_height_inches:
-                selected_size = size
-                break
+            return total_points / 72.0
+        
+        # Largest size in 11-20pt (0.5pt steps) that fits; 11 is the safe fallback
+        selected_size = largest_fitting_size(content_height, 11, 20, max_height_inches)
         
         # Render content with selected size
         for item in content_items:
-            text_val = item['text']
-            item_type = item['type']
+            text_val = item.text
+            item_type = item.type
             
             p = tf.add_paragraph()
             p.font.name = "Calibri"
@@ -97,10 +111,19 @@ def create_presentation():
                 p.font.color.rgb = DARK_GRAY
                 p.space_after = Pt(max(4, selected_size * 0.4))
 
+    # Title style and footer live in the content layout
+    layouts = build_layouts(
+        prs,
+        title=dict(left=Inches(0.5), top=Inches(0.65), width=Inches(9), height=Inches(0.6),
+                   size=32, color=BRICK_RED, font="Arial"),
+        footer=dict(left=Inches(8.2), top=Inches(7.15), width=Inches(1.3), height=Inches(0.3),
+                    text="OTTOBITE 2026", size=10, color=FOOTER_GRAY, font="Calibri"),
+    )
+
     # ==========================================
     # TITLE SLIDE
     # ==========================================
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = prs.slides.add_slide(layouts['blank'])
     
     # Main title
     txBox = slide.shapes.add_textbox(Inches(1), Inches(2.5), Inches(8), Inches(1))
@@ -133,27 +156,18 @@ def create_presentation():
     # ==========================================
     # CONTENT SLIDES
     # ==========================================
-    for slide_info in slides_data:
+    for section in sections:
         # Skip empty or intro-only slides
-        if len(slide_info['content']) == 0:
+        if len(section.items) == 0:
             continue
-        if slide_info['title'] == "OTTOBITE Garson Rehberi" and len(slide_info['content']) < 3:
+        if section.title == "OTTOBITE Garson Rehberi" and len(section.items) < 3:
             continue
         
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide = prs.slides.add_slide(layouts['content'])
         
         # --- HEADER with DYNAMIC SEPARATOR LINE ---
-        title_text = slide_info['title']
-        
-        # Title text box
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.35), Inches(9), Inches(0.9))
-        tp = title_box.text_frame.add_paragraph()
-        tp.text = title_text
-        tp.font.size = Pt(32)
-        tp.font.bold = True
-        tp.font.color.rgb = BRICK_RED
-        tp.font.name = "Arial"
-        tp.alignment = PP_ALIGN.LEFT
+        title_text = section.title
+        set_title(slide, title_text)
         
         # Dynamic separator line (proportional to title length)
         title_length = len(title_text)
@@ -168,24 +182,19 @@ def create_presentation():
         separator.fill.fore_color.rgb = BRICK_RED
         separator.line.fill.background()
         
-        # --- CONTENT SEPARATION ---
-        intro_items = []
-        main_items = []
-        
-        for item in slide_info['content']:
-            if item['type'] == 'intro_box':
-                intro_items.append(item)
-            else:
-                main_items.append(item)
+        # --- CONTENT SEPARATION (precomputed by the structurer) ---
+        intro_items = section.intro
+        main_items = section.main
         
         vertical_cursor = 1.55
         
         # --- COMMENT WINDOW (if intro items exist) ---
         if intro_items:
             # Estimate height needed
-            total_chars = sum(len(item['text']) for item in intro_items)
-            num_items = len(intro_items)
-            estimated_lines = max(num_items, math.ceil(total_chars / 85))
+            # (9" box, 0.25" side margins, 14pt italic Calibri)
+            estimated_lines = sum(
+                wrapped_lines(item.text, 'Calibri', 14, 9.0 * 72 - 36) for item in intro_items
+            )
             box_height = min(1.8, max(0.7, estimated_lines * 0.3 + 0.35))
             
             # Create rounded rectangle
@@ -211,7 +220,7 @@ def create_presentation():
             
             for idx, item in enumerate(intro_items):
                 p = tf.add_paragraph()
-                p.text = item['text']
+                p.text = item.text
                 p.font.size = Pt(font_size)
                 p.font.italic = True
                 p.font.color.rgb = RGBColor(70, 70, 70)
@@ -236,21 +245,13 @@ def create_presentation():
             tf.vertical_anchor = MSO_ANCHOR.TOP
             
             fit_text_content(tf, main_items, max_height_inches=available_height - 0.1)
-        
-        # --- FOOTER ---
-        footer_box = slide.shapes.add_textbox(Inches(8.2), Inches(7.15), Inches(1.3), Inches(0.35))
-        fp = footer_box.text_frame.add_paragraph()
-        fp.text = "OTTOBITE 2026"
-        fp.font.size = Pt(10)
-        fp.font.color.rgb = FOOTER_GRAY
-        fp.alignment = PP_ALIGN.RIGHT
-        fp.font.name = "Calibri"
     
     # ==========================================
     # SAVE PRESENTATION
     # ==========================================
-    prs.save("OTTOBITE_Sunum_FINAL.pptx")
+    prs.save(output_path)
     print("✓ Ultra-Professional V10 Presentation Generated Successfully.")
+    return output_path
 
 if __name__ == "__main__":
     create_presentation()
@@ -8,6 +8,11 @@ from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.text import MSO_ANCHOR
 
+from text_metrics import box_width, width_profile, profile_lines, largest_fitting_size
+
+# Text boxes are 9 inches wide
+CONTENT_TEXT_WIDTH = box_width(9.0)
+
 def create_presentation():
     prs = Presentation()
     BRICK_RED = RGBColor(192, 57, 43)
@@ -25,41 +30,42 @@ def create_presentation():
         We must use strict heuristic calculation.
         """
         
-        # Try sizes: 20, 18, 16, 14, 12, 10
-        sizes = [20, 18, 16, 14, 12, 11, 10]
-        
-        selected_size = 12 # Default fallback
+        # Width profiles once per item (font metrics from text_metrics);
+        # candidate sizes only rescale them
+        profiles = []
+        for item in content_items:
+            text = item['text']
+            if item['type'] == 'subheader':
+                profiles.append((item['type'], width_profile(text, 'Calibri', bold=True)))
+            elif item['type'] == 'bullet':
+                profiles.append((item['type'], width_profile("• " + text, 'Calibri')))
+            elif item['type'] == 'emphasis':
+                profiles.append((item['type'], width_profile(text.upper(), 'Calibri', bold=True)))
+            else:
+                profiles.append((item['type'], width_profile(text, 'Calibri')))
         
-        for size in sizes:
-            current_height = 0
+        def content_height(size):
             # Constants per size
             line_height = size * 1.4 # points
             para_spacing = size * 0.6 # points
             
             total_points = 0
-            
-            for item in content_items:
-                text = item['text']
-                # Wrap estimation: Avg char width approx 0.5 * size
-                # Textbox width approx 9 inches = 648 points
-                # Max chars per line approx 648 / (0.5 * size)
-                max_chars = 900 / (0.6 * size) # rough est
-                
-                lines = math.ceil(len(text) / max_chars)
-                if lines < 1: lines = 1
+            for item_type, profile in profiles:
+                render_size = size + 2 if item_type == 'subheader' else size
+                lines = profile_lines(profile, render_size, CONTENT_TEXT_WIDTH)
                 
                 # Height for this item
                 item_h = (lines * line_height) + para_spacing
-                if item['type'] == 'subheader': item_h += 10
-                if item['type'] == 'quote_box': item_h += 15
+                if item_type == 'subheader': item_h += 10
+                if item_type == 'quote_box': item_h += 15
                 
                 total_points += item_h
             
             # Convert total points to inches
-            total_inches = total_points / 72
-            if total_inches <= max_height_inches:
-                selected_size = size
-                break
+            return total_points / 72
+        
+        # Binary search 10-20pt (0.5pt steps) for the largest size that fits
+        selected_size = largest_fitting_size(content_height, 10, 20, max_height_inches)
         
         # Apply selected size
         for item in content_items:
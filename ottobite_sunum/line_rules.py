@@ -0,0 +1,191 @@
+# encoding: utf-8
+"""
+Kural tablosu ile satır sınıflandırma - structure_* scriptleri için
+if/elif zinciri yerine öncelik sıralı Rule listesi; RuleTable bunu bir kez
+derler, her satır tek geçişte sınıflanır:
+- prefix kuralları ilk karakterden bakılır (dict): sadece o karakterle
+  başlayabilecek kurallar + prefix'siz kurallar denenir
+- Tüm anahtar kelimeler tek birleşik (trie) regex; satır başına bir lower()
+  ve bir tarama, sonuç bütün keyword kurallarınca paylaşılır. Tarama
+  lookahead ile örtüşmeli yapılır ("kabul edilemez" içindeki "edilemez" de
+  bulunur), aynı yerde başlayan kısa kelimeler uzun eşleşmenin önekinden
+  eklenir: sonuç "k in line.lower()" ile aynı küme
+- Tarama maliyeti keyword sayısıyla değil, farklı ilk harf sayısıyla büyür
+  (alfabeyle sınırlı): 3 -> 33 keyword ~1.5x, 100 -> 300 keyword ~1.1x.
+  Az keyword'lü tabloya ilk kez çok harf eklemek sabit maliyetli değildir
+- Her kova için (kural, koşul) adımlarının listesi bir kez kurulur; koşul
+  sadece kuralın verilen alanlarından bir closure, kod üretimi yok
+- Her kuralın isabet sayısı tutulur (table.hits, table.report()) -> kural ayarı için
+
+Rule(name, node, prefix=, suffix=, keywords=, exact=, max_len=, test=, strip=)
+    node: document düğüm sınıfı; None -> satır atlanır
+    verilen tüm koşullar sağlanmalı; strip verilirse baştan lstrip(strip).strip()
+"""
+
+import re
+from collections import Counter
+
+
+class Rule:
+    __slots__ = ('name', 'node', 'prefix', 'suffix', 'keywords', 'exact', 'max_len', 'test', 'strip')
+
+    def __init__(self, name, node, prefix=None, suffix=None, keywords=None, exact=None,
+                 max_len=None, test=None, strip=None):
+        self.name = name
+        self.node = node
+        self.prefix = tuple(prefix) if prefix else None      # tek karakterlik önekler
+        self.suffix = suffix
+        self.keywords = frozenset(keywords) if keywords else None
+        self.exact = exact
+        self.max_len = max_len
+        self.test = test
+        self.strip = strip
+
+    def __repr__(self):
+        return f"Rule({self.name!r})"
+
+
+def keyword_pattern(keywords):
+    """
+    Anahtar kelimelerden önek ağacı (trie) şeklinde regex: ortak önekler bir
+    kez eşlenir, kelime sayısı arttıkça tarama düz alternation gibi büyümez.
+    Uzun eşleşme önceliklidir (kısa kelime opsiyonel devamın önündedir);
+    aynı pozisyondaki kısa kelimeler RuleTable'da önekten bulunur.
+    """
+    trie = {}
+    for word in keywords:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+def _condition(rule):
+    """exact / suffix / max_len koşullarından tek kontrol; koşul yoksa None"""
+    checks = []
+    if rule.exact is not None:
+        exact = rule.exact
+        checks.append(lambda line: line == exact)
+    if rule.suffix is not None:
+        suffix = rule.suffix
+        checks.append(lambda line: line.endswith(suffix))
+    if rule.max_len is not None:
+        max_len = rule.max_len
+        checks.append(lambda line: len(line) < max_len)
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+    return lambda line: all(check(line) for check in checks)
+
+
+class RuleTable:
+    """
+    Derlenmiş kural tablosu; classify(line) -> (Rule, temizlenmiş metin)
+    Her ilk-karakter kovası için (indeks, kural, koşul, keywords, test)
+    adımları sırayla denenir; keyword taraması ilk keyword kuralında bir kez
+    yapılır ve satırın geri kalanı için paylaşılır.
+    """
+
+    def __init__(self, rules, default):
+        self.rules = list(rules) + [default]
+        self.default = default
+        self._counts = [0] * len(self.rules)
+
+        keyword_sets = {rule.keywords for rule in self.rules if rule.keywords}
+        keywords = set().union(*keyword_sets)
+        # Her pozisyonda sıfır genişlikli eşleşme: kelime içindeki kelime de bulunur
+        self._keyword_re = re.compile(f'(?=({keyword_pattern(keywords)}))') if keywords else None
+        # Pozisyondaki en uzun eşleşme -> o pozisyonda başlayan tüm keyword'ler
+        self._prefixes = {word: frozenset(k for k in keywords if word.startswith(k)) for word in keywords}
+
+        prefix_chars = sorted({c for rule in self.rules if rule.prefix for c in rule.prefix})
+        self._unprefixed = self._compile([i for i, rule in enumerate(self.rules) if rule.prefix is None])
+        # İlk karakter -> o satır için denenecek kurallar (öncelik sırasıyla)
+        self._by_first = {
+            char: self._compile([i for i, rule in enumerate(self.rules)
+                                 if rule.prefix is None or char in rule.prefix])
+            for char in prefix_chars
+        }
+
+    def _compile(self, indices):
+        """Kural indekslerinden tek fonksiyon: line -> (Rule, metin)"""
+        steps = []
+        for i in indices:
+            rule = self.rules[i]
+            steps.append([i, rule, _condition(rule), rule.keywords, rule.test, None])
+            if rule.keywords is None and rule.test is None and steps[-1][2] is None:
+                break  # koşulsuz kural (default): sonrası erişilemez
+        # Ardışık keyword kuralları bir blok: keyword'süz satır (genel durum)
+        # bloğun tamamını tek kontrolle atlar -> blok sonrasındaki adım
+        after = len(steps)
+        for n in range(len(steps) - 1, -1, -1):
+            if steps[n][3] is None:
+                after = n
+            else:
+                steps[n][5] = after
+        steps = [tuple(step) for step in steps]
+        counts = self._counts
+        scan = self._keyword_re.findall if self._keyword_re else None
+        found_of = self._found
+
+        def classify(line):
+            found = None
+            n = 0
+            while n < len(steps):
+                i, rule, condition, keywords, test, skip = steps[n]
+                n += 1
+                if keywords is not None:
+                    # Tek lower() + tek birleşik tarama, satırdaki ilk keyword kuralında
+                    if found is None:
+                        found = found_of(scan(line.lower()))
+                    if not found:
+                        n = skip
+                        continue
+                    if found.isdisjoint(keywords):
+                        continue
+                if condition is not None and not condition(line):
+                    continue
+                if test is not None and not test(line):
+                    continue
+                counts[i] += 1
+                return rule, line.lstrip(rule.strip).strip() if rule.strip else line
+
+        return classify
+
+    def _found(self, matches):
+        """Tarama sonucu -> satırdaki keyword kümesi"""
+        if not matches:
+            return frozenset()
+        prefixes = self._prefixes
+        return frozenset().union(*[prefixes[word] for word in matches])
+
+    def classify(self, line):
+        return self._by_first.get(line[:1], self._unprefixed)(line)
+
+    @property
+    def hits(self):
+        """Kural adı -> isabet sayısı"""
+        hits = Counter()
+        for rule, count in zip(self.rules, self._counts):
+            hits[rule.name] += count
+        return hits
+
+    def reset(self):
+        self._counts[:] = [0] * len(self._counts)
+
+    def report(self):
+        """Kural başına isabet sayısı, tablo sırasıyla"""
+        hits = self.hits
+        names = list(dict.fromkeys(rule.name for rule in self.rules))
+        width = max(map(len, names))
+        return '\n'.join(f"  {name:<{width}}  {hits[name]:5d}" for name in names)
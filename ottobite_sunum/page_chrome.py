@@ -0,0 +1,135 @@
+# encoding: utf-8
+"""
+Sayfa başlığı / altlığı (chrome) temizleme - temizleme aşamasından önce
+Her sayfanın ilk ve son EDGE_LINES dolu satırı normalize edilip hash'lenir
+(boşluklar tekleştirilir, rakamlar '#': "Sayfa 3 / 14" ile "Sayfa 4 / 14" aynı
+anahtar); sayfaların MIN_SHARE oranından fazlasında aynı kenarda tekrarlanan
+satırlar atılır. Sayfa ortasındaki aynı metne dokunulmaz.
+
+Bellek / akış (read_pdf.iter_pages sözü: sabit bellek, ilk çıktı PDF bitmeden):
+- Kaynak tekrar gezilebilirse (liste, pipeline kaydı) ilk geçişte sadece kenar
+  satırlarının hash sayıları tutulur, ikinci geçişte sayfalar temizlenir
+- Tek seferlik iterator'da (iter_pages, iter_pages_cached) da karar tüm
+  belgeden: ilk geçişte kayıtlar sayılırken isimsiz bir geçici dosyaya
+  yazılır (pickle), ikinci geçiş oradan okur. Bellekte yine sadece hash
+  sayıları + tek sayfa; ilk çıktı ise kaynak bitince gelir
+
+Cleaner / structurer'lar marka adı veya "SAYFA" gibi özel durumlar bilmek
+zorunda kalmaz; her aşama daha az satır işler.
+
+Kullanım:
+    from page_chrome import strip_chrome
+    pages = strip_chrome(iter_pages("iş1.pdf"))       # aynı (page_no, text[, attrs]) kayıtları
+    python page_chrome.py iş1.pdf                      # bulunan chrome satırları
+"""
+
+import math
+import pickle
+import re
+import tempfile
+from collections import Counter
+
+# Sayfa başı / sonundan bakılacak dolu satır sayısı
+EDGE_LINES = 2
+# Bir kenar satırı sayfaların en az bu oranında tekrarlanırsa chrome
+MIN_SHARE = 0.6
+
+_DIGITS_RE = re.compile(r'\d+')
+
+
+def line_key(line):
+    return hash(_DIGITS_RE.sub('#', ' '.join(line.split())).casefold())
+
+
+def _edges(lines, edge):
+    """(satır indeksi, 'top'/'bottom') - sadece dolu satırlar sayılır"""
+    filled = [i for i, line in enumerate(lines) if line.strip()]
+    for i in filled[:edge]:
+        yield i, 'top'
+    for i in filled[-edge:] if edge else ():
+        yield i, 'bottom'
+
+
+def find_chrome(pages, edge=EDGE_LINES, min_share=MIN_SHARE):
+    """Kayıtlardan chrome anahtarları: {(kenar, hash), ...}"""
+    counts = Counter()
+    n_pages = 0
+    for record in pages:
+        lines = record[1].split('\n')
+        # Aynı sayfada iki kez görünen satır bir kez sayılır
+        counts.update({(side, line_key(lines[i])) for i, side in _edges(lines, edge)})
+        n_pages += 1
+    threshold = max(2, math.ceil(min_share * n_pages))
+    return {key for key, count in counts.items() if count >= threshold}
+
+
+def _strip(record, chrome, edge):
+    """(kayıt, atılan satır sayısı)"""
+    lines = record[1].split('\n')
+    drop = {i for i, side in _edges(lines, edge) if (side, line_key(lines[i])) in chrome}
+    if not drop:
+        return record, 0
+    record = list(record)
+    record[1] = '\n'.join(line for i, line in enumerate(lines) if i not in drop)
+    if len(record) > 2:
+        record[2] = [attr for i, attr in enumerate(record[2]) if i not in drop]
+    return tuple(record), len(drop)
+
+
+def _spool(pages, spool):
+    """Kayıtları akıtırken geçici dosyaya da yazar"""
+    for record in pages:
+        pickle.dump(record, spool, pickle.HIGHEST_PROTOCOL)
+        yield record
+
+
+def _replay(spool):
+    """_spool'un yazdığı kayıtları sırayla okur; bitince dosya silinir"""
+    with spool:
+        spool.seek(0)
+        while True:
+            try:
+                yield pickle.load(spool)
+            except EOFError:
+                return
+
+
+def strip_chrome(pages, edge=EDGE_LINES, min_share=MIN_SHARE, stats=None):
+    """
+    Kayıtları chrome satırları atılmış olarak akıtır (attrs'lı kayıtlarda
+    öznitelikler de hizalı atılır). stats bir dict verilirse 'lines' sayısı yazılır.
+    """
+    if iter(pages) is not pages:
+        # Tekrar gezilebilir: tüm belge üzerinden karar, bellekte sadece hash sayıları
+        chrome = find_chrome(pages, edge, min_share)
+        records = pages
+    else:
+        # Tek seferlik: kaynağı bir kez tüketip geçici dosyadan tekrar oku
+        spool = tempfile.TemporaryFile()
+        chrome = find_chrome(_spool(pages, spool), edge, min_share)
+        records = _replay(spool)
+    removed = 0
+    for record in records:
+        if chrome:
+            record, count = _strip(record, chrome, edge)
+            removed += count
+        yield record
+    if stats is not None:
+        stats['lines'] = stats.get('lines', 0) + removed
+
+
+if __name__ == "__main__":
+    import sys
+    from read_pdf import iter_pages, read_dump
+
+    source = sys.argv[1] if len(sys.argv) > 1 else 'iş1.pdf'
+    pages = list(iter_pages(source) if source.endswith('.pdf') else read_dump(source))
+    found = find_chrome(pages)
+    count = 0
+    for page_no, text, *_ in pages:
+        lines = text.split('\n')
+        for i, side in _edges(lines, EDGE_LINES):
+            if (side, line_key(lines[i])) in found:
+                count += 1
+                print(f"  SAYFA {page_no} {side:<6} {lines[i]!r}")
+    print(f"{len(pages)} sayfa, {count} chrome satırı")
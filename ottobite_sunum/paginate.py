@@ -0,0 +1,65 @@
+# encoding: utf-8
+"""
+Slayt sayfalama - taşan bölümler için optimal kırılma noktaları
+Knuth-Plass paragraf kırma mantığı: her olası kırılma noktası için
+"buraya kadar en iyi maliyet" dinamik programlama ile hesaplanır.
+
+Maliyet (badness) her slayt için:
+- Slayt sayısı (PAGE_PENALTY): greedy'den fazla slayt açılmaz
+- Doluluk farkı: (max_lines - dolu satır)^2 -> yarı boş "(Devam)" slaytı yerine dengeli bölme
+- Slayt sonunda yalnız kalan alt başlık (ORPHAN_PENALTY)
+- Ardışık yorum kutularının (intro_box/quote) iki slayta bölünmesi (INTRO_SPLIT_PENALTY)
+
+Bir slayta en fazla max_lines satır sığdığı için her kırılma noktasında
+geriye doğru sınırlı sayıda aday denenir: O(n * max_lines).
+"""
+
+PAGE_PENALTY = 10000
+ORPHAN_PENALTY = 400
+INTRO_SPLIT_PENALTY = 250
+
+
+def paginate(items, line_cost, max_lines):
+    """
+    items: bölümün içerik listesi (document düğümleri)
+    line_cost: item -> tahmini satır sayısı
+    Dönüş: slayt başına item listeleri (sıra korunur)
+    """
+    n = len(items)
+    if n == 0:
+        return []
+    costs = [line_cost(item) for item in items]
+
+    INF = float('inf')
+    best = [INF] * (n + 1)   # best[j]: items[:j] için en düşük maliyet
+    prev = [0] * (n + 1)     # prev[j]: son slaytın başladığı index
+    best[0] = 0
+
+    for j in range(1, n + 1):
+        fill = 0
+        # items[i:j] son slayt; i geriye doğru, slayt dolunca dur
+        for i in range(j - 1, -1, -1):
+            fill += costs[i]
+            if fill > max_lines and i < j - 1:
+                break
+            if best[i] == INF:
+                continue
+
+            badness = PAGE_PENALTY + max(0, max_lines - fill) ** 2
+            if j < n and items[j - 1].type == 'subheader':
+                badness += ORPHAN_PENALTY
+            if 0 < i and items[i - 1].boxed and items[i].boxed:
+                badness += INTRO_SPLIT_PENALTY
+
+            if best[i] + badness < best[j]:
+                best[j] = best[i] + badness
+                prev[j] = i
+
+    chunks = []
+    j = n
+    while j > 0:
+        i = prev[j]
+        chunks.append(items[i:j])
+        j = i
+    chunks.reverse()
+    return chunks
@@ -0,0 +1,441 @@
+# encoding: utf-8
+"""
+Konum tabanlı PDF metin çıkarma - glyph x/y ve genişliklerinden kelime sınırı
+PyPDF2 extract_text her Tj parçası arasına boşluk koyar; bu PDF'te kerning
+yüzünden kelimeler Td ile kaydırılmış parçalara bölünmüş ("G ar s on").
+Burada content stream operatörleri yürünür:
+- Tm/Td/TD/T*/cm ile her glyph'in sayfa üzerindeki konumu ve efektif punto;
+  q/Q tüm grafik + metin durumunu saklar, Do ile form XObject'lerin içine girilir
+- Genişlik font'un /W (Type0) veya /Widths dizisinden, kod -> unicode ToUnicode'dan
+- Boşluk sadece gerçek boşluk glyph'inde veya önceki glyph'in bitişi ile
+  sonrakinin başlangıcı arasındaki açıklık SPACE_GAP * punto'yu aşınca konur
+- Taban çizgisi (y) değişince yeni satır
+
+Sonuç kaynağında temiz metin; sonradan harf birleştirme / sözlük gerekmez.
+
+Yerleşim öznitelikleri (structure_layout girişi): page_layout her satır için
+[ölçek, kalın, girinti] verir; ölçek = punto / sayfanın gövde puntosu, girinti =
+x - sayfanın sol kenarı. iter_lines bunları LayoutLine (str alt sınıfı) olarak
+taşır; cleaner'lar metni değiştirmezse öznitelikler structure aşamasına ulaşır.
+
+Kullanım:
+    from pdf_layout import page_lines, page_text
+    for line in page_lines(page): line.text, line.x, line.size, line.bold
+    python pdf_layout.py iş1.pdf
+"""
+
+import re
+import weakref
+from collections import Counter
+
+from PyPDF2.generic import ContentStream
+
+# Kelime arası sayılacak en küçük açıklık (punto oranı); kerning bunun altında kalır
+SPACE_GAP = 0.15
+# Taban çizgisi bu kadar (punto oranı) kayarsa yeni satır
+LINE_GAP = 0.5
+
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+_HEX_RE = re.compile(r'<([0-9A-Fa-f]+)>')
+_BFCHAR_RE = re.compile(r'beginbfchar(.*?)endbfchar', re.S)
+_BFRANGE_RE = re.compile(r'beginbfrange(.*?)endbfrange', re.S)
+_RANGE_RE = re.compile(r'<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]+)>\s*(<[0-9A-Fa-f]+>|\[[^\]]*\])')
+
+
+def multiply(m, n):
+    """m x n (PDF 6 elemanlı matris)"""
+    a, b, c, d, e, f = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (a * a2 + b * c2, a * b2 + b * d2,
+            c * a2 + d * c2, c * b2 + d * d2,
+            e * a2 + f * c2 + e2, e * b2 + f * d2 + f2)
+
+
+def _utf16(hex_text):
+    return bytes.fromhex(hex_text).decode('utf-16-be', errors='replace')
+
+
+def parse_cmap(data):
+    """ToUnicode CMap (bfchar / bfrange) -> {kod: metin}"""
+    text = data.decode('latin-1')
+    mapping = {}
+    for block in _BFCHAR_RE.findall(text):
+        codes = _HEX_RE.findall(block)
+        for src, dst in zip(codes[::2], codes[1::2]):
+            mapping[int(src, 16)] = _utf16(dst)
+    for block in _BFRANGE_RE.findall(text):
+        for lo, hi, dst in _RANGE_RE.findall(block):
+            lo, hi = int(lo, 16), int(hi, 16)
+            if dst.startswith('['):
+                for code, item in zip(range(lo, hi + 1), _HEX_RE.findall(dst)):
+                    mapping[code] = _utf16(item)
+            else:
+                # Son karakter artarak ilerler
+                start = _utf16(dst[1:-1])
+                for offset in range(hi - lo + 1):
+                    mapping[lo + offset] = start[:-1] + chr(ord(start[-1]) + offset)
+    return mapping
+
+
+class FontInfo:
+    """Bir font kaynağının kod çözme ve genişlik bilgisi"""
+    __slots__ = ('name', 'bold', 'code_bytes', 'widths', 'default_width', 'to_unicode')
+
+    def __init__(self, font):
+        font = font.get_object()
+        self.name = str(font.get('/BaseFont', '')).split('+')[-1]
+        self.bold = 'bold' in self.name.lower()
+        self.widths = {}
+        self.to_unicode = None
+        if '/ToUnicode' in font:
+            self.to_unicode = parse_cmap(font['/ToUnicode'].get_object().get_data())
+
+        if font.get('/Subtype') == '/Type0':
+            self.code_bytes = 2
+            descendant = font['/DescendantFonts'][0].get_object()
+            self.default_width = float(descendant.get('/DW', 1000))
+            self._read_cid_widths(descendant.get('/W'))
+        else:
+            self.code_bytes = 1
+            self.default_width = 0.0
+            first = int(font.get('/FirstChar', 0))
+            for offset, width in enumerate(font.get('/Widths') or ()):
+                self.widths[first + offset] = float(width)
+
+    def _read_cid_widths(self, w):
+        # /W: "c [w1 w2 ...]" veya "c_ilk c_son w" grupları
+        items = list(w.get_object()) if w is not None else []
+        i = 0
+        while i < len(items):
+            first = int(items[i])
+            nxt = items[i + 1].get_object() if hasattr(items[i + 1], 'get_object') else items[i + 1]
+            if isinstance(nxt, list):
+                for offset, width in enumerate(nxt):
+                    self.widths[first + offset] = float(width)
+                i += 2
+            else:
+                for code in range(first, int(nxt) + 1):
+                    self.widths[code] = float(items[i + 2])
+                i += 3
+
+    def codes(self, data):
+        if isinstance(data, str):
+            # PyPDF2 bazı hex string'leri TextStringObject'e çözer
+            data = data.get_original_bytes() if hasattr(data, 'get_original_bytes') else data.encode('latin-1')
+        if self.code_bytes == 2:
+            return [(data[i] << 8) | data[i + 1] for i in range(0, len(data) - 1, 2)]
+        return list(data)
+
+    def char(self, code):
+        if self.to_unicode is not None:
+            text = self.to_unicode.get(code)
+            if text is not None:
+                return text
+        return bytes([code & 0xFF]).decode('cp1252', errors='replace')
+
+    def width(self, code):
+        """Glyph genişliği, 1000 birim/em"""
+        return self.widths.get(code, self.default_width)
+
+
+class Glyph:
+    """Sayfa koordinatlarında tek glyph (y yukarı doğru artar)"""
+    __slots__ = ('char', 'x', 'y', 'width', 'size', 'font')
+
+    def __init__(self, char, x, y, width, size, font):
+        self.char = char
+        self.x = x
+        self.y = y
+        self.width = width
+        self.size = size
+        self.font = font
+
+    @property
+    def end(self):
+        return self.x + self.width
+
+    def __repr__(self):
+        return f"Glyph({self.char!r}, x={self.x:.1f}, y={self.y:.1f}, size={self.size:.1f})"
+
+
+class Line:
+    """Aynı taban çizgisindeki glyph'lerden kurulan satır"""
+    __slots__ = ('text', 'x', 'y', 'size', 'font', 'bold')
+
+    def __init__(self, text, x, y, size, font, bold=False):
+        self.text = text
+        self.x = x
+        self.y = y
+        self.size = size
+        self.font = font
+        self.bold = bold
+
+    def __repr__(self):
+        return f"Line({self.text!r}, x={self.x:.1f}, size={self.size:.1f}, bold={self.bold})"
+
+
+BULLET_GLYPHS = '•▪◦●■–'
+
+
+class LayoutLine(str):
+    """
+    Yerleşim öznitelikli satır metni; str gibi davranır (strip/startswith ...),
+    ama str dönüşümleri öznitelikleri düşürür -> metni değiştiren cleaner'dan
+    sonra düz str kalır.
+    """
+
+    def __new__(cls, text, scale=1.0, bold=False, indent=0.0):
+        line = super().__new__(cls, text)
+        line.scale = scale      # punto / sayfa gövde puntosu
+        line.bold = bold
+        line.indent = indent    # sol kenardan uzaklık (pt)
+        return line
+
+    @property
+    def bullet(self):
+        """Satır başındaki madde işareti glyph'i ('' yoksa)"""
+        return self[:1] if self[:1] in BULLET_GLYPHS else ''
+
+    def strip(self, chars=None):
+        # Pipeline aşamaları satırı strip() eder; öznitelik kaybolmasın
+        text = str.strip(self, chars)
+        return LayoutLine(text, self.scale, self.bold, self.indent) if text != self else self
+
+    def to_record(self):
+        return [str(self), self.scale, self.bold, self.indent]
+
+
+# PdfReader -> {font obje no: FontInfo}; sayfalar aynı fontu paylaşır, CMap bir kez çözülür
+_FONT_CACHE = weakref.WeakKeyDictionary()
+
+
+def _font(reader, resources, name):
+    ref = resources['/Font'].raw_get(name)
+    idnum = getattr(ref, 'idnum', None)
+    if idnum is None:
+        return FontInfo(ref)
+    fonts = _FONT_CACHE.setdefault(reader, {})
+    info = fonts.get(idnum)
+    if info is None:
+        info = fonts[idnum] = FontInfo(ref)
+    return info
+
+
+class GraphicsState:
+    """q/Q ile saklanan durum: CTM ve metin durumu (Tf, Tc, Tw, Tz, TL, Ts)"""
+    __slots__ = ('ctm', 'font', 'font_size', 'char_spacing', 'word_spacing', 'scale', 'leading', 'rise')
+
+    def __init__(self, ctm=IDENTITY):
+        self.ctm = ctm
+        self.font = None
+        self.font_size = 0.0
+        self.char_spacing = self.word_spacing = self.rise = self.leading = 0.0
+        self.scale = 1.0
+
+    def copy(self):
+        state = GraphicsState.__new__(GraphicsState)
+        for name in GraphicsState.__slots__:
+            setattr(state, name, getattr(self, name))
+        return state
+
+
+def _form(resources, name):
+    """Do operandı form XObject ise (anahtar, stream), değilse (görsel vb.) None"""
+    xobjects = resources.get('/XObject')
+    if xobjects is None:
+        return None
+    xobjects = xobjects.get_object()
+    ref = xobjects.raw_get(name) if name in xobjects else None
+    if ref is None:
+        return None
+    xobject = ref.get_object()
+    if xobject.get('/Subtype') != '/Form':
+        return None
+    return getattr(ref, 'idnum', id(xobject)), xobject
+
+
+def iter_glyphs(page):
+    """Sayfanın glyph'leri, content stream sırasıyla (form XObject'lerin içi dahil)"""
+    contents = page.get_contents()
+    if contents is None:
+        return
+    resources = page['/Resources'].get_object()
+    yield from _walk(page.pdf, ContentStream(contents, page.pdf).operations, resources, GraphicsState(), ())
+
+
+def _walk(reader, ops, resources, base, forms):
+    """
+    Operatör listesini yürür; base giriş durumu (sayfa için varsayılan, form
+    için Do anındaki durum + /Matrix). forms: içinde bulunulan form'lar (döngü koruması)
+    """
+    state = base.copy()
+    stack = []
+    tm = tlm = IDENTITY
+
+    def show(data):
+        nonlocal tm
+        font = state.font
+        if font is None:
+            # Tf'den önce metin: bozuk stream, genişlik / kod çözme bilinmiyor
+            return
+        font_size, scale, ctm = state.font_size, state.scale, state.ctm
+        for code in font.codes(data):
+            char = font.char(code)
+            advance = font.width(code) / 1000 * font_size + state.char_spacing
+            if font.code_bytes == 1 and code == 32:
+                advance += state.word_spacing
+            advance *= scale
+            trm = multiply((font_size * scale, 0, 0, font_size, 0, state.rise), multiply(tm, ctm))
+            start_x, y = trm[4], trm[5]
+            # Efektif punto: metin matrisinin dikey ölçeği
+            size = (trm[2] ** 2 + trm[3] ** 2) ** 0.5
+            tm = multiply((1, 0, 0, 1, advance, 0), tm)
+            end_x = multiply(tm, ctm)[4]
+            yield Glyph(char, start_x, y, end_x - start_x, size, font)
+
+    for operands, op in ops:
+        if op == b'Tj':
+            yield from show(operands[0])
+        elif op == b'TJ':
+            for item in operands[0]:
+                if isinstance(item, (bytes, str)):
+                    yield from show(item)
+                else:
+                    tm = multiply((1, 0, 0, 1, -float(item) / 1000 * state.font_size * state.scale, 0), tm)
+        elif op == b'Td':
+            tlm = tm = multiply((1, 0, 0, 1, float(operands[0]), float(operands[1])), tlm)
+        elif op == b'TD':
+            state.leading = -float(operands[1])
+            tlm = tm = multiply((1, 0, 0, 1, float(operands[0]), float(operands[1])), tlm)
+        elif op == b'Tm':
+            tlm = tm = tuple(float(v) for v in operands)
+        elif op == b'T*':
+            tlm = tm = multiply((1, 0, 0, 1, 0, -state.leading), tlm)
+        elif op in (b"'", b'"'):
+            if op == b'"':
+                state.word_spacing, state.char_spacing = float(operands[0]), float(operands[1])
+            tlm = tm = multiply((1, 0, 0, 1, 0, -state.leading), tlm)
+            yield from show(operands[-1])
+        elif op == b'Tf':
+            state.font = _font(reader, resources, operands[0])
+            state.font_size = float(operands[1])
+        elif op == b'BT':
+            tm = tlm = IDENTITY
+        elif op == b'cm':
+            state.ctm = multiply(tuple(float(v) for v in operands), state.ctm)
+        elif op == b'q':
+            stack.append(state.copy())
+        elif op == b'Q':
+            state = stack.pop() if stack else base.copy()
+        elif op == b'Tc':
+            state.char_spacing = float(operands[0])
+        elif op == b'Tw':
+            state.word_spacing = float(operands[0])
+        elif op == b'Tz':
+            state.scale = float(operands[0]) / 100
+        elif op == b'TL':
+            state.leading = float(operands[0])
+        elif op == b'Ts':
+            state.rise = float(operands[0])
+        elif op == b'Do':
+            form = _form(resources, operands[0])
+            if form is None or form[0] in forms:
+                continue
+            key, xobject = form
+            # Do = q, /Matrix cm, form içeriği, Q: form içindeki değişiklikler dışarı taşmaz
+            inner = state.copy()
+            matrix = tuple(float(v) for v in xobject.get('/Matrix', IDENTITY))
+            inner.ctm = multiply(matrix, state.ctm)
+            form_resources = xobject.get('/Resources')
+            form_resources = form_resources.get_object() if form_resources is not None else resources
+            yield from _walk(reader, ContentStream(xobject, reader).operations, form_resources,
+                             inner, forms + (key,))
+
+
+def _build_line(glyphs):
+    parts = []
+    prev_end = None
+    for glyph in glyphs:
+        if glyph.char.isspace():
+            if parts and parts[-1] != ' ':
+                parts.append(' ')
+            prev_end = glyph.end
+            continue
+        if prev_end is not None and parts and parts[-1] != ' ' \
+                and glyph.x - prev_end > SPACE_GAP * glyph.size:
+            parts.append(' ')
+        parts.append(glyph.char)
+        prev_end = glyph.end
+    text = ''.join(parts).strip()
+    visible = [g for g in glyphs if not g.char.isspace()] or glyphs
+    first = visible[0]
+    bold = sum(g.font.bold for g in visible) * 2 > len(visible)
+    return Line(text, first.x, first.y, first.size, first.font, bold)
+
+
+def page_lines(page):
+    """Glyph'leri taban çizgisine göre satırlara toplar (content stream sırası korunur)"""
+    lines = []
+    current = []
+    for glyph in iter_glyphs(page):
+        if current:
+            last = current[-1]
+            if abs(glyph.y - last.y) > LINE_GAP * max(glyph.size, last.size) \
+                    or glyph.x < last.x - last.size:
+                lines.append(_build_line(current))
+                current = []
+        current.append(glyph)
+    if current:
+        lines.append(_build_line(current))
+    return [line for line in lines if line.text]
+
+
+def page_text(page):
+    return '\n'.join(line.text for line in page_lines(page))
+
+
+def page_layout(page):
+    """
+    Sayfa metni + satır başına [ölçek, kalın, girinti] (tek geçiş).
+    Gövde puntosu: sayfada en çok karakter taşıyan punto; sol kenar: gövde
+    puntosundaki satırların en küçük x'i.
+    """
+    lines = page_lines(page)
+    if not lines:
+        return '', []
+    chars = Counter()
+    for line in lines:
+        chars[round(line.size, 1)] += len(line.text)
+    body = chars.most_common(1)[0][0]
+    margin = min(line.x for line in lines if round(line.size, 1) == body)
+    attrs = [[round(line.size / body, 2), line.bold, round(line.x - margin, 1)] for line in lines]
+    return '\n'.join(line.text for line in lines), attrs
+
+
+def layout_lines(text, attrs):
+    for line, (scale, bold, indent) in zip(text.split('\n'), attrs):
+        yield LayoutLine(line, scale, bold, indent)
+
+
+def lines_to_json(lines):
+    """Aşama cache'i için: LayoutLine -> [metin, ölçek, kalın, girinti], str aynen"""
+    return [line.to_record() if isinstance(line, LayoutLine) else line for line in lines]
+
+
+def lines_from_json(data):
+    return [LayoutLine(*item) if isinstance(item, list) else item for item in data]
+
+
+if __name__ == "__main__":
+    import sys
+    from PyPDF2 import PdfReader
+
+    pdf_path = sys.argv[1] if len(sys.argv) > 1 else "iş1.pdf"
+    with open(pdf_path, 'rb') as f:
+        reader = PdfReader(f)
+        for i, page in enumerate(reader.pages, 1):
+            print(f"\n{'='*60}")
+            print(f"SAYFA {i}")
+            print('='*60)
+            print(page_text(page))
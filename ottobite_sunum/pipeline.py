@@ -0,0 +1,184 @@
+# encoding: utf-8
+"""
+OTTOBITE Sunum Pipeline - tek giriş noktası
+extract -> clean -> structure -> render
+
+- Her aşamanın isimli implementasyonları var (IMPLEMENTATIONS), CLI'dan
+  seçilir; "modul:fonksiyon" yazarak yeni implementasyon da takılabilir
+- Her aşamanın çıktısı .pipeline_cache/ altında saklanır. Anahtar:
+  önceki aşamanın anahtarı + implementasyon adı + kaynak dosyalarının hash'i
+  (modülün import ettiği yerel modüller, dolaylı olanlar dahil)
+  -> bir aşamanın kodu değişirse sadece o ve sonraki aşamalar yeniden çalışır
+
+Kullanım:
+    python pipeline.py iş1.pdf -o OTTOBITE_SUNUM_PRODUCTION.pptx
+    python pipeline.py perfect_text.txt --clean none --render v10_final
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import time
+
+from fingerprint import fingerprint
+
+STAGES = ['extract', 'clean', 'structure', 'render']
+
+# Aşama imzaları:
+#   extract(source_path) -> [(page_no, text), ...] veya (page_no, text, attrs)
+#     attrs: satır başına yerleşim öznitelikleri (pdf_layout.page_layout)
+#   clean(lines) -> lines
+#   structure(lines) -> [document.Section, ...]
+#   render(sections, output_path)
+# structure -> render arası Section nesneleri bellekte geçer; structure cache'i
+# docpack (.otbd), render cache'ten gelirse sadece mmap'lenir
+IMPLEMENTATIONS = {
+    'extract': {
+        'pypdf2': 'extract_cache:iter_pages_cached',
+        'pypdf2_parallel': 'read_pdf:iter_pages_parallel',
+        'layout': 'read_pdf:iter_pages_layout_lines',
+        # Önceden çıkarılmış / elle düzeltilmiş metin (perfect_text.txt, full_content.txt dökümü)
+        'text': 'read_pdf:read_dump',
+    },
+    'clean': {
+        'v9': 'clean_text_v9:clean_lines',
+        'viterbi': 'segment:clean_lines',
+        'viterbi_ottobite': 'segment:clean_lines_ottobite',
+        # Satırlar olduğu gibi geçer; pipeline.py'ye bağlanırsa her değişikliği clean'i bozar
+        'none': 'builtins:iter',
+    },
+    'structure': {
+        'v7': 'structure_content_v7:structure_lines',
+        'perfect': 'structure_perfect:structure_lines',
+        'layout': 'structure_layout:structure_lines',
+    },
+    'render': {
+        'production': 'generate_pptx_production:create_presentation',
+        'production_incremental': 'generate_pptx_production:create_presentation_incremental',
+        'v10_final': 'generate_pptx_v10_final:create_presentation',
+        'final': 'generate_final:create_presentation',
+    },
+}
+
+DEFAULTS = {'extract': 'pypdf2', 'clean': 'v9', 'structure': 'v7', 'render': 'production'}
+
+CACHE_DIR = '.pipeline_cache'
+
+
+def resolve(stage, name):
+    spec = IMPLEMENTATIONS[stage].get(name, name)
+    if ':' not in spec:
+        raise SystemExit(f"Bilinmeyen {stage} implementasyonu: {name} "
+                         f"(seçenekler: {', '.join(IMPLEMENTATIONS[stage])})")
+    module_name, func_name = spec.split(':')
+    module = importlib.import_module(module_name)
+    return spec, module, getattr(module, func_name)
+
+
+def stage_key(prev_key, stage, spec, module):
+    return hashlib.sha256(f"{prev_key}|{stage}|{spec}|{fingerprint(module)}".encode()).hexdigest()[:24]
+
+
+def _load_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _save_json(path, data):
+    # Batch modunda aynı aşama iki işlemde aynı anda yazılabilir
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def run(source, output_path, choices, force=False, cache_dir=CACHE_DIR, theme='default'):
+    from extract_cache import file_hash
+    from read_pdf import iter_lines
+    import docpack
+    import page_chrome
+    import pdf_layout
+    import themes
+
+    os.makedirs(cache_dir, exist_ok=True)
+    key = file_hash(source)
+    data = None
+
+    for stage in STAGES:
+        spec, module, func = resolve(stage, choices[stage])
+        key = stage_key(key, stage, spec, module)
+        if stage == 'clean':
+            # Sayfa chrome'u temizlemeden önce atılır; kodu değişirse clean yeniden çalışır
+            key = stage_key(key, 'chrome', 'page_chrome', page_chrome)
+        if stage == 'render' and theme != 'default':
+            key = stage_key(key, 'theme', theme, themes)
+        ext = {'structure': '.otbd', 'render': '.pptx'}.get(stage, '.json')
+        cached = os.path.join(cache_dir, f"{stage}-{key}{ext}")
+
+        if os.path.exists(cached) and not force:
+            status = 'cache'
+            # Sonraki aşamalardan biri cache'ten gelirse bu veriye hiç gerek kalmaz
+            data = cached
+        else:
+            # Önceki aşama cache'ten geldiyse çıktısı şimdi okunur
+            if isinstance(data, str):
+                data = docpack.load(data) if stage == 'render' else _load_json(data)
+                if stage == 'structure':
+                    # Yerleşim öznitelikli satırlar (extract layout + clean none)
+                    data = pdf_layout.lines_from_json(data)
+            started = time.perf_counter()
+            if stage == 'extract':
+                data = [list(page) for page in func(source)]
+            elif stage == 'clean':
+                data = list(func(iter_lines(page_chrome.strip_chrome(data))))
+            elif stage == 'structure':
+                data = list(func(data))
+            else:
+                tmp = f"{cached}.{os.getpid()}.tmp.pptx"
+                try:
+                    with themes.applied(module, theme):
+                        func(data, tmp)
+                finally:
+                    if isinstance(data, docpack.MappedDocPack):
+                        data.close()
+                os.replace(tmp, cached)
+            if stage == 'structure':
+                docpack.dump(data, cached)
+            elif stage == 'clean':
+                _save_json(cached, pdf_layout.lines_to_json(data))
+            elif stage != 'render':
+                _save_json(cached, data)
+            status = f"{time.perf_counter() - started:.2f}s"
+        print(f"  {stage:<10} {choices[stage]:<24} {status}")
+
+    shutil.copyfile(cached, output_path)
+    print(f"✓ {output_path}")
+    return output_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="OTTOBITE extract -> clean -> structure -> render")
+    parser.add_argument('source', nargs='?', default='iş1.pdf', help="PDF veya düz metin")
+    parser.add_argument('-o', '--output', default='OTTOBITE_SUNUM_PRODUCTION.pptx')
+    for stage in STAGES:
+        parser.add_argument(f'--{stage}', default=None,
+                            help=f"{', '.join(IMPLEMENTATIONS[stage])} veya modul:fonksiyon")
+    parser.add_argument('--theme', default='default', help="themes.THEMES anahtarı")
+    parser.add_argument('--force', action='store_true', help="cache'i yok say")
+    parser.add_argument('--strict-fonts', action='store_true',
+                        help="font metrikleri bulunamazsa tahmine düşme, hata ver")
+    args = parser.parse_args(argv)
+    if args.strict_fonts:
+        os.environ['OTTOBITE_STRICT_FONTS'] = '1'
+
+    choices = {stage: getattr(args, stage) or DEFAULTS[stage] for stage in STAGES}
+    if args.extract is None and not args.source.lower().endswith('.pdf'):
+        choices['extract'] = 'text'
+    run(args.source, args.output, choices, force=args.force, theme=args.theme)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,190 @@
+# encoding: utf-8
+"""
+PDF metin çıkarıcı - sayfa sayfa akış (streaming)
+- iter_pages: (page_no, text) kayıtlarını üretir, sayfa okundukça yield eder
+- iter_pages_parallel: aynı kayıtlar, sayfa aralıkları işlemcilere dağıtılır
+- extract_cache.iter_pages_cached: aynı kayıtlar, disk cache'inden
+- iter_pages_layout: aynı kayıtlar, glyph konumlarından (pdf_layout); boşluklar
+  kaynağında doğru, temizleme gerekmez
+- iter_pages_layout_lines: (page_no, text, attrs); attrs satır başına yerleşim
+  öznitelikleri (pdf_layout.page_layout), structure_layout için
+- read_dump: read_pdf.py döküm dosyasını (full_content.txt) aynı kayıtlara çevirir;
+  "====" / "SAYFA n" ayraçları satır olarak aşağı akmaz
+- iter_lines: sayfaları satır akışına çevirir (cleaner/structurer girişi);
+  attrs'lı kayıtlar pdf_layout.LayoutLine olarak gelir
+Ara dosya (full_content.txt) gerekmez:
+    structure_lines(clean_lines(iter_lines(strip_chrome(iter_pages("iş1.pdf")))))
+"""
+
+import math
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 from PyPDF2 import PdfReader
 
-# PDF dosyasını oku
-reader = PdfReader("iş1.pdf")
+import pdf_layout
+
+# Çıkarma mantığı değişince artırılmalı: extract_cache anahtarlarına girer
+EXTRACTOR_VERSION = "pypdf2-extract_text-1"
+LAYOUT_EXTRACTOR_VERSION = "glyph-layout-1"
+
+
+def extract_page_text(page):
+    return page.extract_text()
+
+
+# Çıkarma modu -> (cache versiyonu, sayfa -> metin)
+EXTRACTORS = {
+    'pypdf2': (EXTRACTOR_VERSION, extract_page_text),
+    'layout': (LAYOUT_EXTRACTOR_VERSION, pdf_layout.page_text),
+}
+
+
+def iter_pages(pdf_path, mode='pypdf2'):
+    # PdfReader'a dosya yolu verilirse tüm PDF'i belleğe okur (BytesIO).
+    # Açık dosya nesnesi verince sadece ihtiyaç duyulan objeler okunur.
+    _, extract = EXTRACTORS[mode]
+    with open(pdf_path, 'rb') as f:
+        reader = PdfReader(f)
+        for i in range(len(reader.pages)):
+            yield i + 1, extract(reader.pages[i])
+
+
+def iter_pages_layout(pdf_path):
+    return iter_pages(pdf_path, mode='layout')
+
+
+def iter_pages_layout_lines(pdf_path):
+    with open(pdf_path, 'rb') as f:
+        reader = PdfReader(f)
+        for i in range(len(reader.pages)):
+            text, attrs = pdf_layout.page_layout(reader.pages[i])
+            yield i + 1, text, attrs
+
+
+def count_pages(pdf_path):
+    with open(pdf_path, 'rb') as f:
+        return len(PdfReader(f).pages)
+
+
+def _extract_range(pdf_path, start, stop, mode='pypdf2'):
+    """Worker: [start, stop) sayfalarını çıkarır -> [(page_no, text, saniye)]"""
+    _, extract = EXTRACTORS[mode]
+    records = []
+    with open(pdf_path, 'rb') as f:
+        reader = PdfReader(f)
+        for i in range(start, stop):
+            t0 = time.perf_counter()
+            text = extract(reader.pages[i])
+            records.append((i + 1, text, time.perf_counter() - t0))
+    return records
+
+
+def iter_pages_parallel(pdf_path, workers=None, timings=None, mode='pypdf2'):
+    """
+    Sayfa aralıklarını ProcessPoolExecutor'a dağıtır, sonuçları sayfa
+    sırasıyla yield eder. timings bir dict verilirse page_no -> saniye yazılır.
+    """
+    workers = workers or os.cpu_count() or 1
+    total = count_pages(pdf_path)
+    if total == 0:
+        return
+    # Çekirdek başına ~4 parça: yavaş sayfalar tek bir worker'ı kilitlemesin
+    shard = max(1, math.ceil(total / (workers * 4)))
+    ranges = [(start, min(start + shard, total)) for start in range(0, total, shard)]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        futures = [pool.submit(_extract_range, pdf_path, start, stop, mode) for start, stop in ranges]
+        # Sıra korunur: sonraki parça hazır olsa da önceki beklenir
+        for future in futures:
+            for page_no, text, elapsed in future.result():
+                if timings is not None:
+                    timings[page_no] = elapsed
+                yield page_no, text
+
+
+# __main__ döküm formatındaki sayfa ayracı
+DUMP_SEPARATOR_RE = re.compile(r'^={10,}\nSAYFA (\d+)\n={10,}\n', re.M)
+
+
+def parse_dump(text):
+    """Döküm metni -> [(page_no, text)]; ayraç yoksa tek sayfa"""
+    parts = DUMP_SEPARATOR_RE.split(text)
+    if len(parts) == 1:
+        return [(1, text)]
+    # print() ayraçtan önce boş satır, sayfa metninden sonra satır sonu ekler
+    return [(int(page_no), body[:-2] if body.endswith('\n\n') else body.rstrip('\n'))
+            for page_no, body in zip(parts[1::2], parts[2::2])]
+
+
+def read_dump(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_dump(f.read())
+
+
+def iter_lines(pages):
+    for record in pages:
+        if len(record) > 2:
+            yield from pdf_layout.layout_lines(record[1], record[2])
+        else:
+            yield from record[1].split('\n')
+
+
+def print_timings(timings, out=sys.stderr):
+    if not timings:
+        return
+    total = sum(timings.values())
+    slowest = sorted(timings.items(), key=lambda kv: kv[1], reverse=True)[:5]
+    print(f"{len(timings)} sayfa, toplam CPU {total:.2f}s, "
+          f"ortalama {total / len(timings) * 1000:.1f}ms/sayfa", file=out)
+    for page_no, elapsed in slowest:
+        print(f"  SAYFA {page_no}: {elapsed * 1000:.1f}ms", file=out)
+
+
+if __name__ == "__main__":
+    # Kullanım: python read_pdf.py [pdf] [--parallel [N] | --cache] [--layout]
+    args = sys.argv[1:]
+    pdf_path = "iş1.pdf"
+    workers = None
+    parallel = False
+    cached = False
+    mode = 'pypdf2'
+    while args:
+        arg = args.pop(0)
+        if arg == "--layout":
+            mode = 'layout'
+        elif arg == "--parallel":
+            parallel = True
+            if args and args[0].isdigit():
+                workers = int(args.pop(0))
+        elif arg == "--cache":
+            cached = True
+        else:
+            pdf_path = arg
+
+    timings = {}
+    stats = {}
+    started = time.perf_counter()
+    if parallel:
+        pages = iter_pages_parallel(pdf_path, workers, timings, mode=mode)
+    elif cached:
+        from extract_cache import iter_pages_cached
+        pages = iter_pages_cached(pdf_path, stats=stats, mode=mode)
+    else:
+        pages = iter_pages(pdf_path, mode=mode)
+
+    # Eski çıktı formatı (full_content.txt) ile uyumlu döküm
+    for page_no, text in pages:
+        print(f"\n{'='*60}")
+        print(f"SAYFA {page_no}")
+        print('='*60)
+        print(text)
 
-# Tüm sayfaların içeriğini yazdır
-for i, page in enumerate(reader.pages):
-    text = page.extract_text()
-    print(f"\n{'='*60}")
-    print(f"SAYFA {i+1}")
-    print('='*60)
-    print(text)
+    if parallel:
+        print_timings(timings)
+        print(f"Duvar saati: {time.perf_counter() - started:.2f}s", file=sys.stderr)
+    if cached:
+        print(f"Cache: {stats['hit']} hit, {stats['miss']} miss", file=sys.stderr)
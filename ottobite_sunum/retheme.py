@@ -0,0 +1,69 @@
+# encoding: utf-8
+"""
+Tema değiştirici - sadece ppt/theme/theme*.xml yeniden yazılır
+create_pptx ve generate_pptx_production renkleri tema slotlarına bağladığı için
+(themes.bind_scheme) default/light_modern/terracotta arası geçiş tek küçük XML
+parçasının değişmesidir; slaytlar, layout'lar ve resimler olduğu gibi kopyalanır.
+Hangi generator'ın ürettiği clrScheme adından okunur, varsayılan renkler oradan.
+
+Kullanım:
+    python retheme.py OTTOBITE_SUNUM_PRODUCTION.pptx terracotta -o OTTOBITE_Terracotta.pptx
+"""
+
+import argparse
+import functools
+import importlib
+import os
+import re
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+for _path in (HERE, ROOT, os.path.join(ROOT, 'pptx_work')):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import themes
+from recolor import recolor_pptx
+
+# bind_scheme'in clrScheme adına yazdığı generator modülleri
+GENERATORS = ('create_pptx', 'generate_pptx_production')
+
+SCHEME_NAME_RE = re.compile(r'<a:clrScheme name="([^"]*)"')
+
+
+def is_theme_part(name):
+    return name.startswith('ppt/theme/') and name.endswith('.xml')
+
+
+def retheme_content(content, theme_name):
+    m = SCHEME_NAME_RE.search(content)
+    if not m or m.group(1) not in GENERATORS:
+        return content  # bind_scheme ile bağlanmamış tema (eski sunumlar)
+    module = importlib.import_module(m.group(1))
+    colors = themes.scheme_colors(module, theme_name)
+    return themes.write_clr_scheme(content.encode('utf-8'), colors).decode('utf-8')
+
+
+def retheme(source, output, theme_name):
+    if theme_name not in themes.THEMES:
+        raise SystemExit(f"Bilinmeyen tema: {theme_name} (seçenekler: {', '.join(themes.THEMES)})")
+    changed = recolor_pptx(source, output, functools.partial(retheme_content, theme_name=theme_name),
+                           select=is_theme_part)
+    if not changed:
+        print(f"  Uyarı: {source} tema slotlarına bağlı değil, renkler değişmedi")
+    return changed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sunumun temasını sadece tema parçasını değiştirerek çevir")
+    parser.add_argument('source')
+    parser.add_argument('theme', help=', '.join(themes.THEMES))
+    parser.add_argument('-o', '--output', required=True)
+    args = parser.parse_args(argv)
+    retheme(args.source, args.output, args.theme)
+    print(f"✓ {args.output}")
+
+
+if __name__ == "__main__":
+    main()
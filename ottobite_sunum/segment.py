@@ -0,0 +1,355 @@
+# encoding: utf-8
+"""
+Sözlük tabanlı kelime yeniden bölütleme (Viterbi) - PyPDF2'nin bozduğu boşluklar
+"G ar s on D a vr anış l arı" -> "Garson Davranışları", "bek lenme zG ar s on" ->
+"beklenmez Garson" (katmanla; genel listede "beklenmez" yok). Kelime başına
+regex yazmak yerine:
+
+- Sözlük: kelime -> frekans, dizi tabanlı trie'de tutulur
+  - lexicon_tr.txt: genel Türkçe frekans listesi (wordfreq 'small' tr listesi,
+    ~61 bin kelime, milyarda frekans; veri CC-BY-SA 4.0, kaynak: wordfreq
+    https://github.com/rspeer/wordfreq, Robyn Speer). Varsayılan sözlük budur
+  - lexicon_ottobite.txt: OTTOBITE el kitabı + bar taslağı kelime sayıları;
+    opsiyonel katman, genel listenin üstüne OVERLAY_WEIGHT payıyla eklenir
+    (pipeline'da --clean viterbi_ottobite)
+- Satırdaki harf dizisi (boşluklar çıkarılmış) DP ile en olası kelime dizisine
+  bölünür; kelime maliyeti -log(frekans / toplam)
+- Sözlükte olmayan orijinal token'lar (isimler, yeni kelimeler) olduğu gibi
+  kalabilir ama parça başına UNKNOWN_COST öder; sözlük dışı yeni parça üretilmez
+- Noktalama, rakam ve çoklu boşluklar sabit sınırdır, yerinde kalır
+- Her pozisyondan trie en fazla en uzun kelime kadar yürür: O(n * L)
+
+Doğruluk (iş1.pdf, perfect_text.txt'e göre kelime isabeti, --evaluate):
+genel liste tek başına REFERANSTAN BAĞIMSIZ ölçümdür. El kitabı katmanı
+perfect_text.txt'ten üretildiği için kendi metninde 0.99 verir (ölçüm değil);
+katmanın katkısı referansın her beşte biri dışarıda tutularak ölçülür:
+    genel liste 0.88, genel + katman (held-out) 0.91,
+    clean_text_v9 0.28, ham döküm 0.20
+Yeni bir PDF'te sadece genel liste kullanılır; katman, o departmanın temiz
+metni zaten varsa eklenir.
+
+Kullanım:
+    from segment import resegment
+    resegment("G ar s on D a vr anış l arı")   # 'Garson Davranışları'
+    python segment.py --build perfect_text.txt ../bar_sunum_icerik_taslak.md   # katman
+    python segment.py --build-base                                            # genel liste (wordfreq gerekir)
+    python segment.py full_content.txt > segmented.txt
+    python segment.py full_content.txt ../bar_sunum_icerik_taslak.md --evaluate perfect_text.txt
+"""
+
+import math
+import os
+import re
+from collections import Counter
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LEXICON_PATH = os.path.join(HERE, 'lexicon_tr.txt')
+OVERLAY_PATH = os.path.join(HERE, 'lexicon_ottobite.txt')
+
+# Katmanın birleşik sözlükteki olasılık payı
+OVERLAY_WEIGHT = 0.3
+# Genel liste: wordfreq frekansı * BASE_SCALE -> tam sayı sayı
+BASE_SCALE = 10 ** 9
+
+# Sözlük dışı orijinal token'ın maliyeti (en nadir sözlük kelimesinden pahalı)
+UNKNOWN_COST = 30.0
+# Hiçbir şeye uymayan tek harf (yol her zaman var olsun diye)
+CHAR_COST = 60.0
+
+# Türkçe küçük harf: İ/I tek karakter kalsın (str.lower 'İ' -> 'i̇' iki karakter)
+_TR_LOWER = str.maketrans({'I': 'ı', 'İ': 'i'})
+
+WORD_RE = re.compile(r'[^\W\d_]+')
+# Sadece harf dizileri ve aralarındaki tek boşluklar bir bölütleme aralığıdır
+SPAN_RE = re.compile(r'[^\W\d_]+(?: [^\W\d_]+)*')
+# "kelime ," -> "kelime," (PyPDF2 noktalamadan önce boşluk bırakır)
+SPACE_BEFORE_PUNCT_RE = re.compile(r'(?<=\w) +(?=[,:.;!?])')
+
+
+def tr_lower(text):
+    return text.translate(_TR_LOWER).lower()
+
+
+class Lexicon:
+    """
+    Kompakt trie: düğümler dizi indeksleri, her düğümün çocukları tek dict,
+    kelime sonu maliyeti ayrı listede (None: kelime değil)
+    """
+
+    def __init__(self, counts):
+        self.children = [{}]
+        self.cost = [None]
+        total = sum(counts.values())
+        self.words = len(counts)
+        self.max_len = 0
+        for word, count in counts.items():
+            node = 0
+            for char in word:
+                nxt = self.children[node].get(char)
+                if nxt is None:
+                    nxt = len(self.children)
+                    self.children[node][char] = nxt
+                    self.children.append({})
+                    self.cost.append(None)
+                node = nxt
+            self.cost[node] = -math.log(count / total)
+            self.max_len = max(self.max_len, len(word))
+
+    def __len__(self):
+        return self.words
+
+    def __contains__(self, word):
+        return self.word_cost(word) is not None
+
+    def word_cost(self, word):
+        node = 0
+        for char in word:
+            node = self.children[node].get(char)
+            if node is None:
+                return None
+        return self.cost[node]
+
+    def prefixes(self, text, start):
+        """text[start:end] sözlükteyse (end, maliyet); trie bitince durur"""
+        node = 0
+        children = self.children
+        for end in range(start, len(text)):
+            node = children[node].get(text[end])
+            if node is None:
+                return
+            cost = self.cost[node]
+            if cost is not None:
+                yield end + 1, cost
+
+    @classmethod
+    def load(cls, path=LEXICON_PATH, overlay=None, weight=OVERLAY_WEIGHT):
+        """overlay: katman sayı dosyası (ör. OVERLAY_PATH) veya sayı dict'i"""
+        counts = read_counts(path)
+        if overlay is not None:
+            if isinstance(overlay, str):
+                overlay = read_counts(overlay)
+            counts = merge_counts(counts, overlay, weight)
+        return cls(counts)
+
+
+def read_counts(path):
+    counts = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip() and not line.startswith('#'):
+                word, count = line.split()
+                counts[word] = int(count)
+    return counts
+
+
+def merge_counts(base, overlay, weight=OVERLAY_WEIGHT):
+    """
+    Katman sayıları, toplam olasılığın weight payını alacak şekilde ölçeklenip
+    genel sayılara eklenir (iki listenin büyüklüğü farklı olsa da oran sabit)
+    """
+    overlay_total = sum(overlay.values())
+    if not overlay_total:
+        return dict(base)
+    scale = weight / (1 - weight) * sum(base.values()) / overlay_total
+    merged = dict(base)
+    for word, count in overlay.items():
+        merged[word] = merged.get(word, 0) + count * scale
+    return merged
+
+
+def words(text):
+    """Küçük harfli kelime listesi"""
+    return WORD_RE.findall(tr_lower(text))
+
+
+def build_counts(paths):
+    """Temiz metinlerden kelime frekansı (küçük harf)"""
+    counts = Counter()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            counts.update(words(f.read()))
+    return counts
+
+
+def base_counts(wordlist='small'):
+    """Genel Türkçe liste (wordfreq opsiyonel bağımlılık, sadece --build-base için)"""
+    try:
+        import wordfreq
+    except ImportError:
+        raise SystemExit("Genel sözlük için wordfreq gerekli: pip install wordfreq")
+    counts = {}
+    for word, freq in wordfreq.get_frequency_dict('tr', wordlist=wordlist).items():
+        count = round(freq * BASE_SCALE)
+        if count and WORD_RE.fullmatch(word) and tr_lower(word) == word:
+            counts[word] = count
+    return counts
+
+
+def save_counts(counts, path=OVERLAY_PATH, header="python segment.py --build ile üretilir"):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"# kelime frekans - {header}\n")
+        for word, count in sorted(counts.items(), key=lambda item: (-item[1], item[0])):
+            f.write(f"{word} {count}\n")
+
+
+_LEXICONS = {}
+
+
+def default_lexicon():
+    """Genel Türkçe liste"""
+    if 'base' not in _LEXICONS:
+        _LEXICONS['base'] = Lexicon.load()
+    return _LEXICONS['base']
+
+
+def ottobite_lexicon():
+    """Genel liste + el kitabı katmanı"""
+    if 'ottobite' not in _LEXICONS:
+        _LEXICONS['ottobite'] = Lexicon.load(overlay=OVERLAY_PATH)
+    return _LEXICONS['ottobite']
+
+
+def segment_span(span, lexicon):
+    """
+    Tek boşluklarla ayrılmış harf token'larını en düşük maliyetli kelime
+    dizisine böler. Dönüş: yeni metin (orijinal harf büyüklüğü korunur).
+    """
+    tokens = span.split(' ')
+    letters = ''.join(tokens)
+    text = tr_lower(letters)
+    n = len(text)
+
+    # Orijinal token sınırları: sözlük dışı token'lar kendi haliyle aday
+    original = {}
+    pos = 0
+    for token in tokens:
+        original[pos] = pos + len(token)
+        pos += len(token)
+
+    INF = float('inf')
+    best = [INF] * (n + 1)
+    back = [0] * (n + 1)
+    best[0] = 0.0
+    for i in range(n):
+        base = best[i]
+        if base == INF:
+            continue
+        for end, cost in lexicon.prefixes(text, i):
+            if base + cost < best[end]:
+                best[end] = base + cost
+                back[end] = i
+        end = original.get(i)
+        if end is not None and base + UNKNOWN_COST < best[end]:
+            best[end] = base + UNKNOWN_COST
+            back[end] = i
+        if base + CHAR_COST < best[i + 1]:
+            best[i + 1] = base + CHAR_COST
+            back[i + 1] = i
+
+    words = []
+    end = n
+    while end > 0:
+        start = back[end]
+        words.append(letters[start:end])
+        end = start
+    words.reverse()
+    return ' '.join(words)
+
+
+def resegment(line, lexicon=None):
+    """Satırdaki tüm harf aralıklarını yeniden bölütler; diğer karakterler yerinde"""
+    if lexicon is None:
+        lexicon = default_lexicon()
+    return SPAN_RE.sub(lambda m: segment_span(m.group(0), lexicon), line)
+
+
+def clean_lines(lines, lexicon=None):
+    """Pipeline clean aşaması: boş satırlar atılır + Viterbi bölütleme (genel sözlük)"""
+    lexicon = lexicon or default_lexicon()
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        line = SPACE_BEFORE_PUNCT_RE.sub('', line)
+        yield resegment(line, lexicon)
+
+
+def clean_lines_ottobite(lines):
+    """clean_lines, el kitabı katmanıyla"""
+    return clean_lines(lines, ottobite_lexicon())
+
+
+def evaluate(raw_lines, reference, extra_paths=(), folds=5, base=None):
+    """
+    Kelime doğruluğu; referans metin ardışık folds parçaya bölünür, her
+    parçanın referans kelimelerinden kaçının çıktıyla hizalandığı sayılır
+    (difflib, kelime düzeyinde). Dönüş: {'base': [...], 'overlay': [...]},
+    her biri [(parça kelime sayısı, isabet), ...]
+    - base: sadece genel liste (referanstan bağımsız)
+    - overlay: genel liste + katman; katman her parça için extra_paths +
+      referansın geri kalanından kurulur (held-out)
+    """
+    from difflib import SequenceMatcher
+
+    base = read_counts(LEXICON_PATH) if base is None else base
+    ref = words(reference)
+    extra = build_counts(extra_paths)
+    raw_lines = [SPACE_BEFORE_PUNCT_RE.sub('', line.strip()) for line in raw_lines if line.strip()]
+    bounds = [len(ref) * k // folds for k in range(folds + 1)]
+
+    def score(lexicon, start, end):
+        out = words(' '.join(resegment(line, lexicon) for line in raw_lines))
+        matcher = SequenceMatcher(None, ref, out, autojunk=False)
+        return sum(max(0, min(a + size, end) - max(a, start))
+                   for a, _, size in matcher.get_matching_blocks())
+
+    base_lexicon = Lexicon(base)
+    results = {'base': [], 'overlay': []}
+    for start, end in zip(bounds, bounds[1:]):
+        overlay = extra + Counter(ref[:start] + ref[end:])
+        results['base'].append((end - start, score(base_lexicon, start, end)))
+        results['overlay'].append((end - start, score(Lexicon(merge_counts(base, overlay)), start, end)))
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sözlük tabanlı kelime bölütleme")
+    parser.add_argument('sources', nargs='*', default=['full_content.txt'])
+    parser.add_argument('--build', action='store_true',
+                        help="sources temiz metinlerinden katman (lexicon_ottobite.txt) üret")
+    parser.add_argument('--build-base', action='store_true',
+                        help="wordfreq Türkçe listesinden genel sözlük (lexicon_tr.txt) üret")
+    parser.add_argument('--evaluate', metavar='REFERENCE',
+                        help="sources[0] ham döküm, sources[1:] ek sözlük metinleri; "
+                             "REFERENCE'ın her parçası sözlük dışında tutularak ölçülür")
+    args = parser.parse_args()
+
+    if args.evaluate:
+        from read_pdf import iter_lines, read_dump
+
+        with open(args.evaluate, 'r', encoding='utf-8') as f:
+            reference = f.read()
+        results = evaluate(iter_lines(read_dump(args.sources[0])), reference, args.sources[1:])
+        labels = {'base': "genel liste", 'overlay': "genel + katman (held-out)"}
+        for name, folds in results.items():
+            parts = '  '.join(f"{hits / total:.2f}" for total, hits in folds)
+            accuracy = sum(h for _, h in folds) / sum(t for t, _ in folds)
+            print(f"  {labels[name]:<26} {accuracy:.2f}   parçalar: {parts}")
+    elif args.build_base:
+        counts = base_counts()
+        save_counts(counts, LEXICON_PATH, "python segment.py --build-base ile wordfreq 'small' tr "
+                                          "listesinden üretilir (veri CC-BY-SA 4.0, Robyn Speer)")
+        print(f"✓ {len(counts)} kelime -> {LEXICON_PATH}")
+    elif args.build:
+        counts = build_counts(args.sources)
+        save_counts(counts)
+        print(f"✓ {len(counts)} kelime -> {OVERLAY_PATH}")
+    else:
+        from page_chrome import strip_chrome
+        from read_pdf import iter_lines, read_dump
+
+        for source in args.sources:
+            for line in clean_lines(iter_lines(strip_chrome(read_dump(source)))):
+                print(line)
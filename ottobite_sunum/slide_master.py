@@ -0,0 +1,125 @@
+# encoding: utf-8
+"""
+Slide master / layout kurucu - her slaytta tekrarlanan dekorasyon bir kez yazılır
+- Arka plan rengi slide master'a yazılır, tüm layout ve slaytlar miras alır
+- 'content' layout'u (varsayılan şablonun Title Only'si): başlık placeholder'ı
+  konumu/fontu, footer metni, slayt numarası alanı (<a:fld type="slidenum">)
+- 'blank' layout'u: sadece arka plan (kapak gibi serbest slaytlar)
+Slayta sadece değişken metin yazılır; sunum açıldıktan sonra arka plan, footer
+ve başlık stili PowerPoint'te Slide Master'dan tek yerden değiştirilebilir.
+
+Kullanım:
+    layouts = build_layouts(prs, background=ARKA_PLAN,
+                            title=dict(left=..., top=..., width=..., height=..., size=26, color=KIREMIT),
+                            number=dict(left=..., top=..., width=..., height=..., size=10, total=55))
+    slide = prs.slides.add_slide(layouts['content'])
+    set_title(slide, "Başlık")
+"""
+
+from xml.sax.saxutils import escape
+
+from pptx.enum.text import PP_ALIGN
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.shapes.autoshape import CT_Shape
+
+# python-pptx varsayılan şablonundaki layout sırası
+TITLE_ONLY_LAYOUT = 5
+BLANK_LAYOUT = 6
+
+# Slayt numarası alanının sabit kimliği (PowerPoint her sunumda aynısını kullanır)
+SLIDENUM_FIELD_ID = '{B6F15528-21DE-4FAA-801E-634DDDAF4B2B}'
+
+ALIGN = {PP_ALIGN.LEFT: 'l', PP_ALIGN.CENTER: 'ctr', PP_ALIGN.RIGHT: 'r'}
+
+
+def _run_props(size, color, font, bold=False):
+    bold_attr = ' b="1"' if bold else ''
+    fill = f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>' if color is not None else ''
+    latin = f'<a:latin typeface="{font}"/>' if font else ''
+    return f'sz="{int(size * 100)}"{bold_attr}>{fill}{latin}'
+
+
+def style_title(layout, left, top, width, height, size, color, font='+mn-lt', bold=True):
+    """Layout'un başlık placeholder'ını konumlar; font/renk lstStyle ile miras verilir"""
+    title = layout.placeholders[0]
+    title.left, title.top, title.width, title.height = left, top, width, height
+
+    tx_body = title._element.txBody
+    body_pr = tx_body.find(qn('a:bodyPr'))
+    body_pr.set('wrap', 'square')
+    body_pr.set('anchor', 't')
+    for child in list(body_pr):
+        body_pr.remove(child)
+    body_pr.append(parse_xml(f'<a:noAutofit {nsdecls("a")}/>'))
+
+    lst_style = tx_body.find(qn('a:lstStyle'))
+    for child in list(lst_style):
+        lst_style.remove(child)
+    lst_style.append(parse_xml(
+        f'<a:lvl1pPr {nsdecls("a")} algn="l"><a:defRPr {_run_props(size, color, font, bold)}</a:defRPr></a:lvl1pPr>'
+    ))
+
+
+def add_text(layout, left, top, width, height, text='', size=10, color=None, font=None,
+             align=PP_ALIGN.RIGHT, slide_number=False, total=None):
+    """
+    Layout'a sabit metin kutusu ekler (placeholder değil; her slaytta görünür).
+    slide_number=True ise metin yerine slayt numarası alanı, total verilirse "n/total".
+    """
+    # LayoutShapes'ta add_textbox yok; slayttaki text box ile aynı XML elle eklenir
+    shapes = layout.shapes
+    shape_id = shapes._next_shape_id
+    box = CT_Shape.new_textbox_sp(shape_id, f"TextBox {shape_id - 1}", left, top, width, height)
+    shapes._spTree.insert_element_before(box, 'p:extLst')
+    p = box.txBody.p_lst[0]
+    p.get_or_add_pPr().set('algn', ALIGN[align])
+    run_props = _run_props(size, color, font)
+    if slide_number:
+        p.append(parse_xml(
+            f'<a:fld {nsdecls("a")} id="{SLIDENUM_FIELD_ID}" type="slidenum">'
+            f'<a:rPr lang="tr-TR" {run_props}</a:rPr><a:t>‹#›</a:t></a:fld>'
+        ))
+        if total is not None:
+            text = f"/{total}"
+    if text:
+        p.append(parse_xml(
+            f'<a:r {nsdecls("a")}><a:rPr lang="tr-TR" {run_props}</a:rPr><a:t>{escape(text)}</a:t></a:r>'
+        ))
+    return box
+
+
+def build_layouts(prs, background=None, title=None, footer=None, number=None):
+    """
+    prs'in master/layout setini bir kez kurar; {'blank': ..., 'content': ...} döner.
+    title:  style_title argümanları (dict)
+    footer: add_text argümanları (dict)
+    number: add_text argümanları (dict, slide_number=True eklenir)
+    """
+    if background is not None:
+        fill = prs.slide_master.background.fill
+        fill.solid()
+        fill.fore_color.rgb = background
+
+    content = prs.slide_layouts[TITLE_ONLY_LAYOUT]
+    if title:
+        style_title(content, **title)
+    if footer:
+        add_text(content, **footer)
+    if number:
+        add_text(content, slide_number=True, **number)
+    return {'blank': prs.slide_layouts[BLANK_LAYOUT], 'content': content}
+
+
+def set_title(slide, text):
+    """content layout'lu slaytın başlığını yazar (stil layout'tan gelir)"""
+    title = slide.shapes.title
+    title.text_frame.text = text
+    return title
+
+
+def drop_title(slide):
+    """Başlığı kullanılmayan content slaytından boş placeholder'ı kaldırır"""
+    title = slide.shapes.title
+    if title is not None:
+        title._element.getparent().remove(title._element)
@@ -2,14 +2,37 @@
 import re
 import json
 
-def structure_content(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        text = f.read()
-    
-    lines = text.split('\n')
-    slides = []
-    
-    current_slide = {"title": "OTTOBITE Garson Rehberi", "content": []}
+from document import BodyText, Bullet, Emphasis, IntroBox, Quote, Section, Subheader, to_json
+from docpack import dump
+from line_rules import Rule, RuleTable
+
+EMPHASIS_KEYWORDS = ("kabul edilemez", "zorunludur", "esastır")
+
+# Logic V7, öncelik sırasıyla (ilk eşleşen kazanır):
+# - Starts with '-': INTRO_BOX (Commentary)
+# - Starts with '•': BULLET
+# - Ends with ':': SUBHEADER
+RULES = [
+    Rule('intro_box', IntroBox, prefix='-', strip='- '),
+    Rule('bullet', Bullet, prefix='•', strip='• '),
+    Rule('subheader_colon', Subheader, suffix=':'),
+    # Strict emphasis for short lines; long ones stay body text
+    Rule('emphasis', Emphasis, keywords=EMPHASIS_KEYWORDS, max_len=60),
+    Rule('emphasis_long', BodyText, keywords=EMPHASIS_KEYWORDS),
+    # Speech: shown in the commentary window
+    Rule('quote', Quote, prefix='“"'),
+    Rule('ottobite', None, exact="OTTOBITE"),
+    # Subheader check for non-colon lines
+    Rule('subheader_short', Subheader, max_len=50,
+         test=lambda line: line[0].isupper() and not line.endswith('.')),
+]
+
+RULE_TABLE = RuleTable(RULES, default=Rule('body_text', BodyText))
+
+
+def iter_sections(lines, table=RULE_TABLE):
+    """Satır akışından bölümleri (document.Section) üretir; her bölüm tamamlanınca yield edilir"""
+    current_slide = Section("OTTOBITE Garson Rehberi")
     header_pattern = re.compile(r'^\d+\.?\s+.+')
     
     for line in lines:
@@ -17,68 +40,46 @@ def structure_content(file_path):
         if not line: continue
         
         if header_pattern.match(line):
-            if current_slide:
-                slides.append(current_slide)
-            current_slide = {
-                "title": line,
-                "content": []
-            }
-        else:
-            clean_item = line
-            item_type = "body_text" # Default
-            
-            # Logic Update V7:
-            # - Starts with '-': INTRO_BOX (Commentary)
-            # - Starts with '•': BULLET
-            # - Ends with ':': SUBHEADER
-            
-            if line.startswith('-'):
-                # Commentary / Intro
-                item_type = "intro_box"
-                clean_item = line.lstrip('- ').strip()
-                
-            elif line.startswith('•'):
-                # Bullet
-                item_type = "bullet"
-                clean_item = line.lstrip('• ').strip()
-            
-            elif line.endswith(':'):
-                item_type = "subheader"
-            
-            elif "kabul edilemez" in line.lower() or "zorunludur" in line.lower() or "esastır" in line.lower():
-                # Strict emphasis for short lines
-                if len(line) < 60:
-                    item_type = "emphasis"
-                else:
-                    item_type = "body_text"
-            
-            elif line.startswith('“') or line.startswith('"'):
-                 item_type = "intro_box" # Speech is also commentary-like
-            
-            elif line == "OTTOBITE":
-                continue
-            
-            else:
-                 # Subheader check for non-colon lines?
-                 if len(line) < 50 and line[0].isupper() and not line.endswith('.'):
-                     item_type = "subheader"
-                 else:
-                     item_type = "body_text"
-
-            if clean_item:
-                current_slide["content"].append({
-                    "type": item_type,
-                    "text": clean_item
-                })
-
-    if current_slide:
-        slides.append(current_slide)
-        
-    return slides
+            yield current_slide
+            current_slide = Section(line)
+            continue
+
+        rule, clean_item = table.classify(line)
+        if rule.node is not None and clean_item:
+            current_slide.add(rule.node(clean_item))
+
+    yield current_slide
+
+
+def structure_lines(lines):
+    return list(iter_sections(lines))
+
+
+def structure_content(file_path):
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return structure_lines(f)
+
+
+if __name__ == "__main__":
+    import sys
 
-slides = structure_content('perfect_text.txt')
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    source = args[0] if args else 'perfect_text.txt'
+    if source.endswith('.pdf'):
+        # PDF -> clean -> structure, ara dosya olmadan sayfa sayfa (çıkarma cache'li)
+        from read_pdf import iter_lines
+        from extract_cache import iter_pages_cached
+        from clean_text_v9 import clean_lines
+        from page_chrome import strip_chrome
+        slides = structure_lines(clean_lines(iter_lines(strip_chrome(iter_pages_cached(source)))))
+    else:
+        slides = structure_content(source)
 
-with open('structured_data_final_v7.json', 'w', encoding='utf-8') as f:
-    json.dump(slides, f, ensure_ascii=False, indent=2)
+    with open('structured_data_final_v7.json', 'w', encoding='utf-8') as f:
+        json.dump(to_json(slides), f, ensure_ascii=False, indent=2)
+    # Kompakt ikili kopya (docpack): mmap + bölüm bazında okuma
+    dump(slides, 'structured_data_final_v7.otbd')
 
-print("Structured Final V7 complete.")
+    print("Structured Final V7 complete.")
+    if '--stats' in sys.argv:
+        print(RULE_TABLE.report())
@@ -0,0 +1,119 @@
+# encoding: utf-8
+"""
+Yerleşim tabanlı yapılandırma - satırlar PDF'teki punto / kalınlık / girinti /
+madde glyph'i ile sınıflanır (pdf_layout.LayoutLine). Numara regex'i ve
+"len(line) < 50 and line[0].isupper()" gibi tahminler yerine:
+- Başlık: kalın ve gövdeden büyük punto (ölçek >= HEADING_SCALE)
+  numaralıysa (veya ilk başlıksa) yeni bölüm, değilse alt başlık ("// " atılır)
+- Madde: satır başında madde glyph'i, ya da girintili ve büyük harfle başlıyor
+- Vurgu: gövde puntosunda kalın satır
+Her satır tek geçişte RuleTable ile sınıflanır. Öznitelik taşımayan düz metin
+(perfect_text.txt, metni değiştiren cleaner'lar) structure_content_v7 kurallarına düşer.
+
+Kullanım:
+    python pipeline.py iş1.pdf --extract layout --clean none --structure layout
+    python structure_layout.py iş1.pdf --stats
+"""
+
+import json
+import re
+from itertools import chain
+
+from document import BodyText, Bullet, Emphasis, IntroBox, Quote, Section, Subheader, to_json
+from docpack import dump
+from line_rules import Rule, RuleTable
+from pdf_layout import BULLET_GLYPHS, LayoutLine
+import structure_content_v7
+
+# Gövde puntosunun bu katı ve kalınsa başlık (18pt/12pt = 1.5, 14pt/12pt = 1.17)
+HEADING_SCALE = 1.1
+# Bu kadar (pt) girintili satır madde seviyesinde
+INDENT = 12.0
+
+NUMBERED_RE = re.compile(r'^\d+\.?\s+.+')
+SUBHEADING_MARKS = '/ '
+
+
+def _indented_item(line):
+    return line.indent >= INDENT and line[0].isupper()
+
+
+def _bold(line):
+    return line.bold
+
+
+# Öncelik sırasıyla; başlıklar tablodan önce ayrılır
+RULES = [
+    Rule('bullet', Bullet, prefix=BULLET_GLYPHS, strip=BULLET_GLYPHS + ' '),
+    Rule('intro_box', IntroBox, prefix='-', strip='- '),
+    Rule('quote', Quote, prefix='“"'),
+    Rule('subheader', Subheader, suffix=':'),
+    Rule('emphasis', Emphasis, test=_bold),
+    Rule('indented_bullet', Bullet, test=_indented_item),
+]
+
+RULE_TABLE = RuleTable(RULES, default=Rule('body_text', BodyText))
+
+
+def is_heading(line):
+    return line.bold and line.scale >= HEADING_SCALE
+
+
+def iter_sections(lines, table=RULE_TABLE):
+    """Satır akışından bölümleri üretir; akış LayoutLine değilse v7'ye devredilir"""
+    lines = (line.strip() for line in lines)
+    lines = (line for line in lines if line)
+    first = next(lines, None)
+    if first is None:
+        return
+    if not isinstance(first, LayoutLine):
+        # Metni değiştiren cleaner veya düz metin kaynağı: öznitelik yok
+        yield from structure_content_v7.iter_sections(chain([first], lines))
+        return
+
+    current = None
+    for line in chain([first], lines):
+        if is_heading(line):
+            # İlk başlık belge başlığı; sonrakiler numaralıysa yeni bölüm
+            if current is None or NUMBERED_RE.match(line):
+                if current is not None:
+                    yield current
+                current = Section(str(line))
+            else:
+                current.add(Subheader(line.lstrip(SUBHEADING_MARKS).strip()))
+            continue
+        if current is None:
+            current = Section("OTTOBITE Garson Rehberi")
+
+        rule, text = table.classify(line)
+        if rule.node is not None and text:
+            current.add(rule.node(text))
+
+    if current is not None:
+        yield current
+
+
+def structure_lines(lines):
+    return list(iter_sections(lines))
+
+
+if __name__ == "__main__":
+    import sys
+
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    source = args[0] if args else 'iş1.pdf'
+    if source.endswith('.pdf'):
+        from read_pdf import iter_lines, iter_pages_layout_lines
+        from page_chrome import strip_chrome
+        slides = structure_lines(iter_lines(strip_chrome(iter_pages_layout_lines(source))))
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            slides = structure_lines(f)
+
+    with open('structured_data_layout.json', 'w', encoding='utf-8') as f:
+        json.dump(to_json(slides), f, ensure_ascii=False, indent=2)
+    dump(slides, 'structured_data_layout.otbd')
+
+    print(f"Structured Layout complete: {len(slides)} bölüm.")
+    if '--stats' in sys.argv:
+        print(RULE_TABLE.report())
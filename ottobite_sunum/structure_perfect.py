@@ -13,49 +13,51 @@ Pattern identified:
 import re
 import json
 
-def structure_content(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        text = f.read()
-    
-    lines = text.split('\n')
+from document import BodyText, Bullet, Emphasis, IntroBox, Quote, Section, Subheader, to_json
+from docpack import dump
+from line_rules import Rule, RuleTable
+
+# Intro (before the first numbered header)
+INTRO_RULES = [
+    Rule('ottobite', None, exact="OTTOBITE"),
+    Rule('subtitle', Subheader, exact="Garson Davranışları ve İş Önceliği Rehberi"),
+    Rule('intro_box', IntroBox, prefix='-', strip='- '),   # Commentary text
+    Rule('bullet', Bullet, prefix='•', strip='• '),
+    Rule('subheader', Subheader, suffix=':'),
+]
+
+# Main content, in priority order
+RULES = [
+    Rule('intro_box', IntroBox, prefix='-', strip='- '),   # Commentary/intro box
+    Rule('bullet', Bullet, prefix='•', strip='• '),
+    Rule('quote', Quote, prefix='"'),                      # Quote/speech - commentary window
+    Rule('subheader', Subheader, suffix=':', max_len=60),
+    Rule('emphasis', Emphasis, keywords=("kabul edilemez", "zorunludur"), max_len=40),
+]
+
+INTRO_RULE_TABLE = RuleTable(INTRO_RULES, default=Rule('body_text', BodyText))
+RULE_TABLE = RuleTable(RULES, default=Rule('body_text', BodyText))
+
+
+def structure_lines(lines, intro_table=INTRO_RULE_TABLE, table=RULE_TABLE):
+    lines = list(lines)
     slides = []
     
-    current_slide = None
     header_pattern = re.compile(r'^(\d+)\.\s+(.+)')
     
     # First slide is intro
-    intro_slide = {
-        "title": "OTTOBITE Garson Rehberi",
-        "content": []
-    }
+    intro_slide = Section("OTTOBITE Garson Rehberi")
     
     i = 0
     # Process intro (lines 1-10)
     while i < len(lines) and not header_pattern.match(lines[i].strip()):
         line = lines[i].strip()
+        i += 1
         if not line:
-            i += 1
-            continue
-        
-        if line == "OTTOBITE":
-            i += 1
             continue
-        
-        if line == "Garson Davranışları ve İş Önceliği Rehberi":
-            intro_slide["content"].append({"type": "subheader", "text": line})
-        elif line.startswith('-'):
-            # Commentary text
-            clean = line.lstrip('- ').strip()
-            intro_slide["content"].append({"type": "intro_box", "text": clean})
-        elif line.startswith('•'):
-            clean = line.lstrip('• ').strip()
-            intro_slide["content"].append({"type": "bullet", "text": clean})
-        elif line.endswith(':'):
-            intro_slide["content"].append({"type": "subheader", "text": line})
-        else:
-            intro_slide["content"].append({"type": "body_text", "text": line})
-        
-        i += 1
+        rule, clean = intro_table.classify(line)
+        if rule.node is not None:
+            intro_slide.add(rule.node(clean))
     
     slides.append(intro_slide)
     
@@ -64,73 +66,55 @@ def structure_content(file_path):
     
     while i < len(lines):
         line = lines[i].strip()
+        i += 1
         
         if not line:
-            i += 1
             continue
         
         # Check for header
-        match = header_pattern.match(line)
-        if match:
-            if current_slide:
+        if header_pattern.match(line):
+            if current_slide is not None:
                 slides.append(current_slide)
-            
-            current_slide = {
-                "title": line,
-                "content": []
-            }
-            i += 1
+            current_slide = Section(line)
             continue
         
         if current_slide is None:
-            i += 1
             continue
         
-        # Classify content
-        if line.startswith('-'):
-            # Commentary/intro box
-            clean = line.lstrip('- ').strip()
-            current_slide["content"].append({"type": "intro_box", "text": clean})
-        
-        elif line.startswith('•'):
-            # Bullet point
-            clean = line.lstrip('• ').strip()
-            current_slide["content"].append({"type": "bullet", "text": clean})
-        
-        elif line.startswith('"') or line.startswith('"'):
-            # Quote/speech - also treat as intro_box
-            current_slide["content"].append({"type": "intro_box", "text": line})
-        
-        elif line.endswith(':') and len(line) < 60:
-            # Subheader
-            current_slide["content"].append({"type": "subheader", "text": line})
-        
-        elif "kabul edilemez" in line.lower() and len(line) < 40:
-            # Emphasis
-            current_slide["content"].append({"type": "emphasis", "text": line})
-        
-        elif "zorunludur" in line.lower() and len(line) < 40:
-            current_slide["content"].append({"type": "emphasis", "text": line})
-        
-        else:
-            # Body text
-            current_slide["content"].append({"type": "body_text", "text": line})
-        
-        i += 1
+        rule, clean = table.classify(line)
+        current_slide.add(rule.node(clean))
     
-    if current_slide:
+    if current_slide is not None:
         slides.append(current_slide)
     
     return slides
 
-slides = structure_content('perfect_text.txt')
 
-# Output
-with open('structured_data_perfect.json', 'w', encoding='utf-8') as f:
-    json.dump(slides, f, ensure_ascii=False, indent=2)
+def structure_content(file_path):
+    with open(file_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    return structure_lines(text.split('\n'))
+
+
+if __name__ == "__main__":
+    import sys
+
+    slides = structure_content('perfect_text.txt')
+
+    # Output
+    with open('structured_data_perfect.json', 'w', encoding='utf-8') as f:
+        json.dump(to_json(slides), f, ensure_ascii=False, indent=2)
+    # Kompakt ikili kopya (docpack): mmap + bölüm bazında okuma
+    dump(slides, 'structured_data_perfect.otbd')
+
+    print(f"✓ Structured {len(slides)} slides from PDF content")
 
-print(f"✓ Structured {len(slides)} slides from PDF content")
+    # Print summary
+    for s in slides[:5]:
+        print(f"  - {s.title}: {len(s.items)} items")
 
-# Print summary
-for s in slides[:5]:
-    print(f"  - {s['title']}: {len(s['content'])} items")
+    if '--stats' in sys.argv:
+        print("Intro rules:")
+        print(INTRO_RULE_TABLE.report())
+        print("Content rules:")
+        print(RULE_TABLE.report())
@@ -0,0 +1,204 @@
+# encoding: utf-8
+"""
+Metin ölçüm motoru - gerçek TTF metrikleriyle satır sayısı hesabı
+- Font dosyası sistem font klasörlerinde aranır (Calibri/Arial veya
+  metrik uyumlu Carlito/Liberation Sans)
+- Karakter genişlikleri 1000 birim/em ölçeğinde bir kez okunur, cache'lenir
+- wrapped_lines(text, font, size, width) kelime kaydırmayla kaç satır
+  tutacağını verir; sonuç (text, font, size, width, bold) ile memoize edilir
+- Önce bu klasördeki fonts/ aranır: Calibri'si olmayan makinede (Linux, CI)
+  metrik uyumlu Carlito-Regular.ttf / Carlito-Bold.ttf (OFL) buraya konur
+- Font bulunamazsa ortalama karakter genişliğine düşer (eski karakter sayısı
+  tahmini, ölçüm değil): font başına bir kez stderr'e uyarı yazılır.
+  OTTOBITE_STRICT_FONTS=1 (pipeline.py --strict-fonts) ile düşmek yerine hata verir
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+try:
+    from PIL import ImageFont
+except ImportError:  # python-pptx Pillow'u zaten getirir
+    ImageFont = None
+
+REF_SIZE = 1000  # font bu piksel boyutunda açılır -> genişlik = em * 1000
+
+FONT_FILES = {
+    ('Calibri', False): ['calibri.ttf', 'Calibri.ttf', 'Carlito-Regular.ttf'],
+    ('Calibri', True): ['calibrib.ttf', 'Calibri Bold.ttf', 'Carlito-Bold.ttf'],
+    ('Calibri Light', False): ['calibril.ttf', 'Calibri Light.ttf', 'Carlito-Regular.ttf'],
+    ('Arial', False): ['arial.ttf', 'Arial.ttf', 'LiberationSans-Regular.ttf'],
+    ('Arial', True): ['arialbd.ttf', 'Arial Bold.ttf', 'LiberationSans-Bold.ttf'],
+}
+
+FONT_DIRS = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fonts'),
+    os.path.expanduser('~/Library/Fonts'),
+    '/Library/Fonts',
+    '/System/Library/Fonts/Supplemental',
+    '/Applications/Microsoft PowerPoint.app/Contents/Resources/DFonts',
+    'C:\\Windows\\Fonts',
+    os.path.expanduser('~/.fonts'),
+    os.path.expanduser('~/.local/share/fonts'),
+    '/usr/share/fonts',
+    '/usr/local/share/fonts',
+]
+
+# Font dosyası yoksa kullanılan ortalama karakter genişliği (em) - sadece tahmin
+FALLBACK_EM = {'Calibri': 0.49, 'Calibri Light': 0.48, 'Arial': 0.55}
+
+# python-pptx text box varsayılan iç boşluğu (sol + sağ 0.1")
+DEFAULT_INSET_PT = 14.4
+
+
+def strict_fonts():
+    """Font yoksa tahmine düşmek yerine hata ver (ortam değişkeni: worker process'lere de geçer)"""
+    return os.environ.get('OTTOBITE_STRICT_FONTS', '') not in ('', '0')
+
+
+@lru_cache(maxsize=None)
+def find_font_file(name, bold=False):
+    candidates = FONT_FILES.get((name, bold)) or FONT_FILES.get((name, False), [])
+    wanted = {c.lower() for c in candidates}
+    for root in FONT_DIRS:
+        if not os.path.isdir(root):
+            continue
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                if filename.lower() in wanted:
+                    return os.path.join(dirpath, filename)
+    return None
+
+
+class FontMetrics:
+    def __init__(self, name, bold=False):
+        self.name = name
+        self.bold = bold
+        self.path = find_font_file(name, bold)
+        self._font = None
+        if self.path and ImageFont is not None:
+            self._font = ImageFont.truetype(self.path, REF_SIZE)
+        self._advance = {}
+        self.fallback_em = FALLBACK_EM.get(name, 0.5) * (1.05 if bold else 1.0)
+        if self._font is None:
+            style = f"{name}{' Bold' if bold else ''}"
+            reason = "Pillow yok" if self.path else "font dosyası bulunamadı"
+            if strict_fonts():
+                raise FileNotFoundError(f"{style} metrikleri okunamadı: {reason}; "
+                                        f"Carlito / Liberation Sans dosyalarını fonts/ klasörüne koyun")
+            print(f"  Uyarı: {style} metrikleri okunamadı ({reason}), "
+                  f"satır hesabı ortalama genişlik tahminiyle ({self.fallback_em:.2f} em)", file=sys.stderr)
+
+    def advance(self, char):
+        """Karakter genişliği (em)"""
+        em = self._advance.get(char)
+        if em is None:
+            if self._font is not None:
+                em = self._font.getlength(char) / REF_SIZE
+            else:
+                em = self.fallback_em
+            self._advance[char] = em
+        return em
+
+    def width(self, text, size):
+        """Metnin genişliği (pt); kerning yok sayılır"""
+        return sum(self.advance(c) for c in text) * size
+
+
+@lru_cache(maxsize=None)
+def metrics(name, bold=False):
+    return FontMetrics(name, bold)
+
+
+def text_width(text, font='Calibri', size=14, bold=False):
+    return metrics(font, bold).width(text, size)
+
+
+@lru_cache(maxsize=65536)
+def wrapped_lines(text, font='Calibri', size=14, width=648.0, bold=False):
+    """
+    text'in width (pt) genişliğindeki kutuda kaç satıra kaydırılacağı.
+    Boşluklardan kırılır; satırdan uzun kelime harf harf bölünür.
+    """
+    if not text:
+        return 1
+    m = metrics(font, bold)
+    space = m.advance(' ') * size
+    lines = 1
+    used = 0.0
+    for word in text.split(' '):
+        w = m.width(word, size)
+        if used and used + space + w <= width:
+            used += space + w
+            continue
+        if used:
+            lines += 1
+        if w <= width:
+            used = w
+            continue
+        # Kutudan geniş tek kelime: harf harf taşar
+        used = 0.0
+        for c in word:
+            cw = m.advance(c) * size
+            if used and used + cw > width:
+                lines += 1
+                used = 0.0
+            used += cw
+    return lines
+
+
+def box_width(width_inches, inset_pt=DEFAULT_INSET_PT):
+    """Text box genişliğinden (inç) satır için kullanılabilir genişlik (pt)"""
+    return width_inches * 72.0 - inset_pt
+
+
+@lru_cache(maxsize=65536)
+def width_profile(text, font='Calibri', bold=False):
+    """
+    Boyuttan bağımsız genişlik profili: (boşluk em, kelime genişlikleri em).
+    Bir kez hesaplanır, her font boyutunda sadece ölçeklenir.
+    """
+    m = metrics(font, bold)
+    return m.advance(' '), tuple(sum(m.advance(c) for c in word) for word in text.split(' '))
+
+
+def profile_lines(profile, size, width):
+    """wrapped_lines'ın profil üzerinden hızlı hali (uzun kelime ~ ceil bölme)"""
+    space_em, words = profile
+    limit = width / size  # satır genişliği em cinsinden
+    lines = 1
+    used = 0.0
+    for w in words:
+        if used and used + space_em + w <= limit:
+            used += space_em + w
+            continue
+        if used:
+            lines += 1
+        if w > limit:
+            full = int(w // limit)
+            lines += full
+            used = w - full * limit
+        else:
+            used = w
+    return lines
+
+
+def largest_fitting_size(height_at, lo, hi, max_height, step=0.5):
+    """
+    height_at(size) <= max_height olan en büyük boyut, step hassasiyetinde.
+    Kaydırılmış yükseklik boyutla monoton arttığı için ikili arama yeterli.
+    Hiçbiri sığmazsa lo döner.
+    """
+    lo_i, hi_i = 0, int(round((hi - lo) / step))
+    if height_at(lo + hi_i * step) <= max_height:
+        return hi
+    best = 0
+    while lo_i <= hi_i:
+        mid = (lo_i + hi_i) // 2
+        if height_at(lo + mid * step) <= max_height:
+            best = mid
+            lo_i = mid + 1
+        else:
+            hi_i = mid - 1
+    return lo + best * step
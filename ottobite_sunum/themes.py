@@ -0,0 +1,198 @@
+# encoding: utf-8
+"""
+Renk temaları - generator modüllerinin renk sabitlerini geçici olarak değiştirir
+Anahtarlar generator'lardaki sabit isimleri:
+- generate_pptx_production: BRICK_RED, DARK_GRAY, LIGHT_BG, BORDER_COLOR, FOOTER_GRAY
+- create_pptx (servis):      KIREMIT, ACCENT, ARKA_PLAN, GRI_KUTU, BEYAZ, ACIK_GRI
+Modülde olmayan anahtarlar atlanır. Hex değerleri pptx_work/update_colors*.py paletleri.
+
+Tema renk slotları (bind_scheme): generator sabitleri ppt/theme/theme1.xml
+clrScheme slotlarına yazılır, slaytlarda o sabitlerden gelen renkler schemeClr
+referansına çevrilir. Sonradan tema değiştirmek sadece tema parçasını
+değiştirmektir (retheme.py) - slayt XML'lerine dokunulmaz.
+
+Bağlama sabit adına göredir, hex değerine göre değil: @scheme_bound render
+süresince her bağlı sabiti isme özel bir yer tutucu renge çevirir
+(terracotta'da BRICK_RED ve DARK_GRAY aynı hex olsa da ayrı slotlara gider).
+"""
+
+import functools
+import sys
+from contextlib import contextmanager
+
+from lxml import etree
+from pptx.dml.color import RGBColor
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+from pptx.oxml.xmlchemy import OxmlElement
+
+THEMES = {
+    'default': {},
+    'light_modern': {
+        'BRICK_RED': 'E85A4F',
+        'DARK_GRAY': '2D3748',
+        'LIGHT_BG': 'F7FAFC',
+        'FOOTER_GRAY': 'A0AEC0',
+        'KIREMIT': 'E85A4F',
+        'ACCENT': 'E85A4F',
+        'ARKA_PLAN': 'FFFFFF',
+        'GRI_KUTU': 'F7FAFC',
+        'BEYAZ': '2D3748',
+        'ACIK_GRI': '4A5568',
+    },
+    'terracotta': {
+        'BRICK_RED': '4A2C2A',
+        'DARK_GRAY': '4A2C2A',
+        'LIGHT_BG': 'F5E6D3',
+        'FOOTER_GRAY': 'D4A088',
+        'KIREMIT': '4A2C2A',
+        'ACCENT': '4A2C2A',
+        'ARKA_PLAN': 'C4785C',
+        'GRI_KUTU': 'A86B4F',
+        'BEYAZ': 'F5E6D3',
+        'ACIK_GRI': 'F5E6D3',
+    },
+}
+
+
+# Sabit adı -> clrScheme slotu (iki generator ayrı sunum ürettiği için slotlar çakışmaz)
+SCHEME_SLOTS = {
+    # generate_pptx_production
+    'BRICK_RED': 'accent1',
+    'DARK_GRAY': 'dk2',
+    'LIGHT_BG': 'lt2',
+    'BORDER_COLOR': 'accent3',
+    'FOOTER_GRAY': 'accent4',
+    # create_pptx (servis)
+    'KIREMIT': 'accent1',
+    'ACCENT': 'accent2',
+    'ARKA_PLAN': 'dk2',
+    'GRI_KUTU': 'accent3',
+    'BEYAZ': 'lt1',
+    'ACIK_GRI': 'lt2',
+}
+
+
+# Sabit adı -> render sırasında kullanılan benzersiz yer tutucu hex
+PLACEHOLDERS = {name: f'FEED{index:02X}' for index, name in enumerate(SCHEME_SLOTS)}
+
+# Modül adı -> render süresince gerçek {slot: hex} renkleri (scheme_bound)
+_BOUND = {}
+
+
+@contextmanager
+def placeholders(module):
+    """
+    Modülün slot sabitlerini yer tutucu renklere çevirir; gerçek renkler
+    {slot: hex} olarak döner ve bind_scheme tarafından tema parçasına yazılır.
+    """
+    colors = scheme_colors(module)
+    previous = {}
+    for name in SCHEME_SLOTS:
+        if hasattr(module, name):
+            previous[name] = getattr(module, name)
+            setattr(module, name, RGBColor.from_string(PLACEHOLDERS[name]))
+    _BOUND[module.__name__] = colors
+    try:
+        yield colors
+    finally:
+        del _BOUND[module.__name__]
+        for name, value in previous.items():
+            setattr(module, name, value)
+
+
+def scheme_bound(func):
+    """
+    Generator'ın create_presentation'ı için dekoratör: render yer tutucu
+    renklerle yapılır, fonksiyon içindeki bind_scheme onları sabitin slotuna bağlar.
+    İç içe çağrıda (incremental -> create_presentation) bir kez uygulanır.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        module = sys.modules[func.__module__]
+        if module.__name__ in _BOUND:
+            return func(*args, **kwargs)
+        with placeholders(module):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+@contextmanager
+def applied(module, theme_name):
+    """with applied(generate_pptx_production, 'terracotta'): create_presentation(...)"""
+    if theme_name not in THEMES:
+        raise SystemExit(f"Bilinmeyen tema: {theme_name} (seçenekler: {', '.join(THEMES)})")
+    previous = {}
+    for name, hex_value in THEMES[theme_name].items():
+        if hasattr(module, name):
+            previous[name] = getattr(module, name)
+            setattr(module, name, RGBColor.from_string(hex_value))
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(module, name, value)
+
+
+def scheme_colors(module, theme_name=None):
+    """{slot: hex} - modülün güncel sabitleri, theme_name verilirse o temanın değerleri"""
+    overrides = THEMES[theme_name] if theme_name else {}
+    colors = {}
+    for name, slot in SCHEME_SLOTS.items():
+        if hasattr(module, name):
+            colors[slot] = overrides.get(name, str(getattr(module, name))).upper()
+    return colors
+
+
+def write_clr_scheme(theme_xml, colors, scheme_name=None):
+    """theme XML'inde (bytes) clrScheme slotlarını colors ile değiştirir"""
+    root = etree.fromstring(theme_xml)
+    scheme = root.find('.//' + qn('a:clrScheme'))
+    if scheme_name:
+        scheme.set('name', scheme_name)
+    for slot, hex_value in colors.items():
+        slot_el = scheme.find(qn(f'a:{slot}'))
+        for child in list(slot_el):
+            slot_el.remove(child)
+        etree.SubElement(slot_el, qn('a:srgbClr')).set('val', hex_value)
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def bind_scheme(prs, module, generator):
+    """
+    Kaydetmeden önce çağrılır: modülün renkleri tema parçasına yazılır ve
+    slide/layout/master'daki srgbClr'ler schemeClr'ye çevrilir.
+    clrScheme adı generator modül adıdır; retheme.py varsayılan renkleri oradan okur.
+
+    @scheme_bound altında yer tutucu renkler sabitin slotuna bağlanır. Dışında
+    hex değerine göre bağlanır; iki slot aynı renkteyse hangisi olduğu
+    bilinemez -> ValueError.
+    """
+    colors = _BOUND.get(module.__name__)
+    if colors is not None:
+        slot_of = {PLACEHOLDERS[name]: slot for name, slot in SCHEME_SLOTS.items() if hasattr(module, name)}
+    else:
+        colors = scheme_colors(module)
+        slot_of = {}
+        for slot, hex_value in colors.items():
+            if hex_value in slot_of:
+                raise ValueError(f"{generator}: {slot_of[hex_value]} ve {slot} aynı renk ({hex_value}); "
+                                 f"create_presentation @scheme_bound ile render edilmeli")
+            slot_of[hex_value] = slot
+
+    master = prs.slide_master
+    theme_part = master.part.part_related_by(RT.THEME)
+    theme_part._blob = write_clr_scheme(theme_part.blob, colors, generator)
+
+    elements = [master._element] + [layout._element for layout in prs.slide_layouts]
+    elements += [slide._element for slide in prs.slides]
+    for element in elements:
+        for srgb in list(element.iter(qn('a:srgbClr'))):
+            slot = slot_of.get(srgb.get('val', '').upper())
+            if slot is None:
+                continue
+            scheme_clr = OxmlElement('a:schemeClr')
+            scheme_clr.set('val', slot)
+            scheme_clr.extend(list(srgb))  # lumMod/alpha gibi alt ayarlar korunur
+            srgb.getparent().replace(srgb, scheme_clr)
+    return colors
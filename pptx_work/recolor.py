@@ -0,0 +1,272 @@
+# encoding: utf-8
+"""
+PPTX renk değiştirme motoru - zip'ten zip'e, diske açmadan
+- Kaynak .pptx zipfile ile okunur, çıktı doğrudan yeni arşive yazılır
+- Sadece slide/layout/master XML'leri (renk referansı içerenler) dönüştürülür
+- Diğer tüm parçalar (resimler, rels, docProps) olduğu gibi akıtılır;
+  sıra, tarih ve sıkıştırma tipi korunur
+- rm/unzip/zip subprocess'i ve geçici klasör yok
+
+Kullanım:
+    from recolor import recolor_pptx
+    recolor_pptx('OTTOBITE_Garson_Rehberi.pptx', 'OTTOBITE_Final_Modern.pptx', update_content)
+update_content(str) -> str, XML parçasının yeni içeriği. Palet değişimi için
+PaletteMap: tüm eşlemeler tek sözlükte, her parça tek regex taramasıyla.
+
+Toplu kullanım (klasördeki tüm sunumlar, her sunum ayrı worker'da):
+    python recolor.py light *.pptx -o light_decks/ [-j 4]
+Büyük tek sunumda (PARALLEL_MIN_BYTES üstü XML) parçalar da worker
+havuzunda dönüştürülür: recolor_pptx(..., workers=4)
+
+Doğrulama / diff raporu (aynı taramada toplanır, ek geçiş yok):
+    python recolor.py light *.pptx --dry-run --report rapor.json
+Parça başına bulunan renkler, eşlendikleri renkler ve değişen adet;
+palette olmayan renkler "unmapped" olarak işaretlenir.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import re
+import shutil
+import sys
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Eski scriptlerin gezdiği klasörler: ppt/slides, ppt/slideLayouts, ppt/slideMasters
+RECOLOR_DIRS = ('ppt/slides/', 'ppt/slideLayouts/', 'ppt/slideMasters/')
+COLOR_MARKER = b'srgbClr'
+
+COPY_CHUNK = 1 << 20
+
+# Bunun altında process başlatma maliyeti dönüşümden pahalı
+PARALLEL_MIN_BYTES = 4 << 20
+
+# Paletler update_colors*.py scriptlerinde, "modul:degisken"
+PALETTES = {
+    'modern': 'update_colors:PALETTE',
+    'fresh': 'update_colors_v2:PALETTE',
+    'light': 'update_colors_v3:PALETTE',
+    'terracotta': 'update_colors_terracotta:PALETTE',
+}
+
+SRGB_RE = re.compile(r'(srgbClr val=")([0-9A-Fa-f]{6})(")')
+
+
+class PaletteMap:
+    """
+    Eski renk -> yeni renk eşlemesi, büyük/küçük harf duyarsız.
+    Her srgbClr değeri bir kez okunur ve sözlükten bakılır; sonuç bir sonraki
+    kuralın girdisi olmaz (FFFFFF hem hedef hem kaynak olabilir, zincirlenmez).
+    Palet büyüklüğü tarama maliyetini değiştirmez.
+    """
+
+    def __init__(self, mapping):
+        self.mapping = {}
+        for old, new in mapping.items():
+            old, new = old.upper(), new.upper()
+            if self.mapping.get(old, new) != new:
+                raise ValueError(f"{old} iki farklı renge eşlenmiş: {self.mapping[old]}, {new}")
+            self.mapping[old] = new
+
+    def _replace(self, m):
+        new = self.mapping.get(m.group(2).upper())
+        if new is None:
+            return m.group(0)
+        return m.group(1) + new + m.group(3)
+
+    def apply(self, content):
+        return SRGB_RE.sub(self._replace, content)
+
+    def remap(self, content):
+        """apply + istatistik: (yeni içerik, {found, mapped, unmapped}) tek taramada"""
+        found = Counter()
+        mapped = Counter()
+
+        def replace(m):
+            old = m.group(2).upper()
+            found[old] += 1
+            new = self.mapping.get(old)
+            if new is None:
+                return m.group(0)
+            if new != old:
+                mapped[f"{old}->{new}"] += 1
+            return m.group(1) + new + m.group(3)
+
+        content = SRGB_RE.sub(replace, content)
+        stats = {
+            'found': dict(found),
+            'mapped': dict(mapped),
+            'unmapped': {color: n for color, n in found.items() if color not in self.mapping},
+        }
+        return content, stats
+
+    __call__ = apply
+
+
+def is_recolor_part(name):
+    """ppt/slides/slide1.xml gibi doğrudan klasör altındaki XML'ler (_rels hariç)"""
+    for prefix in RECOLOR_DIRS:
+        if name.startswith(prefix):
+            rest = name[len(prefix):]
+            return '/' not in rest and rest.endswith('.xml') and not rest.startswith('_')
+    return False
+
+
+def _remap_part(job):
+    update_content, name, data = job
+    try:
+        content = data.decode('utf-8')
+    except UnicodeDecodeError as e:
+        raise ValueError(f"{name}: UTF-8 XML olarak okunamadı ({e})") from e
+    stats = None
+    if isinstance(update_content, PaletteMap):
+        updated, stats = update_content.remap(content)
+    else:
+        updated = update_content(content)
+    return name, (updated.encode('utf-8') if updated != content else None), stats
+
+
+def summarize(parts):
+    """Parça istatistiklerinden sunum toplamları"""
+    totals = {'found': Counter(), 'mapped': Counter(), 'unmapped': Counter()}
+    for stats in parts.values():
+        for key, counter in totals.items():
+            counter.update(stats[key])
+    return {
+        'parts': parts,
+        'changed': sum(totals['mapped'].values()),
+        **{key: dict(counter.most_common()) for key, counter in totals.items()},
+    }
+
+
+def recolor_pptx(source, output, update_content, workers=1, select=is_recolor_part, report=None):
+    """
+    source arşivini output'a kopyalarken renk parçalarına update_content uygular.
+    select(name) hangi parçaların dönüştürüleceğini seçer (varsayılan slide/layout/master).
+    workers > 1 ve XML yeterince büyükse parçalar paralel dönüştürülür
+    (update_content picklable olmalı: PaletteMap veya modül seviyesi fonksiyon).
+    output None ise hiçbir şey yazılmaz (dry-run). report bir dict ise
+    PaletteMap istatistikleri (summarize formatında) içine doldurulur.
+    Dönüş: içeriği değişen parça isimleri.
+    """
+    with zipfile.ZipFile(source) as zin:
+        infos = zin.infolist()
+        jobs = []
+        for info in infos:
+            if select(info.filename):
+                data = zin.read(info)
+                if COLOR_MARKER in data:
+                    jobs.append((update_content, info.filename, data))
+
+        if workers > 1 and sum(len(job[2]) for job in jobs) >= PARALLEL_MIN_BYTES:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunk = max(1, len(jobs) // (workers * 4))
+                outcomes = list(pool.map(_remap_part, jobs, chunksize=chunk))
+        else:
+            outcomes = list(map(_remap_part, jobs))
+
+        results = {name: data for name, data, _ in outcomes}
+        if report is not None:
+            report.update(summarize({name: stats for name, _, stats in outcomes if stats is not None}))
+        if output is None:
+            return [name for name, data in results.items() if data is not None]
+
+        changed = []
+        tmp = f"{output}.{os.getpid()}.tmp"
+        with zipfile.ZipFile(tmp, 'w') as zout:
+            for info in infos:
+                data = results.get(info.filename)
+                if data is not None:
+                    zout.writestr(info, data)
+                    changed.append(info.filename)
+                else:
+                    # Değişmeyen parçalar (resim, rels, ...) parça parça akıtılır
+                    with zin.open(info) as src, zout.open(info, 'w') as dst:
+                        shutil.copyfileobj(src, dst, COPY_CHUNK)
+    os.replace(tmp, output)
+    return changed
+
+
+def count_slides(names):
+    return sum(1 for name in names if name.startswith('ppt/slides/'))
+
+
+def load_palette(name):
+    spec = PALETTES.get(name, name)
+    if ':' not in spec:
+        raise SystemExit(f"Bilinmeyen palet: {name} (seçenekler: {', '.join(PALETTES)})")
+    module_name, attr = spec.split(':')
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    return PaletteMap(getattr(importlib.import_module(module_name), attr))
+
+
+def _recolor_job(job):
+    source, output, update_content = job
+    started = time.perf_counter()
+    report = {}
+    changed = recolor_pptx(source, output, update_content, report=report)
+    return source, output, len(changed), report, time.perf_counter() - started
+
+
+def recolor_batch(sources, output_dir, update_content, workers=None, report_path=None):
+    """
+    Her sunum ayrı worker process'te; çıktılar output_dir/<aynı isim>.
+    output_dir None ise dry-run: sadece rapor. report_path'e JSON özet yazılır.
+    """
+    if output_dir is not None:
+        output_dir = os.path.abspath(output_dir)
+        if any(os.path.dirname(os.path.abspath(src)) == output_dir for src in sources):
+            raise SystemExit("Çıktı klasörü kaynak klasörle aynı olamaz (orijinaller ezilir)")
+        os.makedirs(output_dir, exist_ok=True)
+    jobs = [(src, output_dir and os.path.join(output_dir, os.path.basename(src)), update_content)
+            for src in sources]
+    workers = min(workers or os.cpu_count() or 1, len(jobs)) or 1
+
+    started = time.perf_counter()
+    if workers <= 1:
+        results = [_recolor_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_recolor_job, jobs))
+
+    summary = {}
+    for source, output, changed, report, elapsed in results:
+        print(f"  {elapsed:6.2f}s  {changed:3d} parça  {report.get('changed', 0):5d} renk  {output or source}")
+        if report.get('unmapped'):
+            flagged = ', '.join(f"{color}×{n}" for color, n in report['unmapped'].items())
+            print(f"           ! palette olmayan renkler: {flagged}")
+        summary[source] = report
+    print(f"✓ {len(results)} sunum, {workers} worker, toplam {time.perf_counter() - started:.2f}s")
+
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        print(f"✓ Rapor: {report_path}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sunumları tek seferde yeni palete çevir")
+    parser.add_argument('palette', help=f"{', '.join(PALETTES)} veya modul:degisken")
+    parser.add_argument('sources', nargs='+', help=".pptx dosyaları")
+    parser.add_argument('-o', '--output-dir', default=None)
+    parser.add_argument('-j', '--jobs', type=int, default=None, help="worker sayısı")
+    parser.add_argument('--dry-run', action='store_true', help="hiçbir şey yazma, sadece raporla")
+    parser.add_argument('--report', default=None, help="JSON diff raporu yolu")
+    args = parser.parse_args(argv)
+    if args.dry_run:
+        args.output_dir = None
+    elif args.output_dir is None:
+        parser.error("-o/--output-dir gerekli (veya --dry-run)")
+    recolor_batch(args.sources, args.output_dir, load_palette(args.palette), args.jobs, args.report)
+
+
+if __name__ == "__main__":
+    main()